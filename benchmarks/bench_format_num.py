@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: format_num / format_column gegen das alte replace-über-"TEMP"-Formatieren
+Prüft zuerst, dass deutsche und US-Ausgabe identisch bleiben
+
+    python benchmarks/bench_format_num.py [rows]
+"""
+
+import os, random, sys, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from nominalwert_rechner import NUMBER_LOCALES, format_column, format_num
+
+
+def format_num_legacy(value: float, decimals: int = 2, number_format: str = "german") -> str:
+    """format_num before the formatter objects - reference for results and speed."""
+    if number_format == "german":
+        return f"{value:,.{decimals}f}".replace(",", "TEMP").replace(".", ",").replace("TEMP", ".")
+    return f"{value:,.{decimals}f}"
+
+
+def best_of(fn, repeat: int = 5) -> float:
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t)
+    return min(times)
+
+
+def main(rows: int = 200_000):
+    rnd = random.Random(1)
+    values = [rnd.uniform(-2e6, 2e6) for _ in range(rows)]
+    for number_format in ("german", "us"):
+        for d in (0, 2, 6):
+            if [format_num(v, d, number_format) for v in values[:2000]] != \
+               [format_num_legacy(v, d, number_format) for v in values[:2000]]:
+                raise SystemExit(f"Mismatch: {number_format}, {d} decimals")
+    for number_format in NUMBER_LOCALES:
+        if number_format in ("german", "us"):
+            legacy = best_of(lambda: [format_num_legacy(v, 2, number_format) for v in values])
+            base = f"legacy {legacy * 1e3:7.1f} ms | "
+        else:
+            legacy, base = None, " " * 21
+        single = best_of(lambda: [format_num(v, 2, number_format) for v in values])
+        column = best_of(lambda: format_column(values, 2, number_format))
+        speedup = (lambda t: f" ({legacy / t:.2f}x)" if legacy else "")
+        print(f"{number_format:6} {rows} values: {base}format_num {single * 1e3:7.1f} ms{speedup(single)} | "
+              f"format_column {column * 1e3:7.1f} ms{speedup(column)}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
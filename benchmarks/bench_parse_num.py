@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: parse_num / parse_many gegen den alten split/replace-Parser
+Prüft zuerst, dass beide für alle Testwerte dasselbe liefern (auch dieselben Fehler)
+
+    python benchmarks/bench_parse_num.py [rows]
+"""
+
+import os, random, sys, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from nominalwert_rechner import parse_many, parse_num
+
+
+def parse_num_legacy(s: str, number_format: str = "german") -> float:
+    """parse_num before the translation tables - reference for results and speed."""
+    if not s.strip(): return 0.0
+    s = s.strip()
+    if number_format == "german":
+        if "," in s and "." in s:
+            s = s.replace(".", "").replace(",", ".")
+        elif "," in s:
+            parts = s.split(",")
+            if len(parts) == 2 and len(parts[1]) <= 3:
+                s = s.replace(",", ".")
+        elif "." in s:
+            parts = s.split(".")
+            if len(parts) > 1 and len(parts[-1]) <= 3 and len(parts[-1]) > 0:
+                s = "".join(parts[:-1]) + "." + parts[-1]
+            else:
+                s = s.replace(".", "")
+    else:
+        s = s.replace(",", "")
+    return float(s)
+
+
+EDGE_CASES = ["", "  ", "0", "42", " 7 ", "1,5", "1,25", "1,234", "1,2345", "1,2,3", "1.5", "1.234", "1.2345",
+              "1.234.567", "1.234.567,89", "115.327,2", "115,327.2", "1.", ".5", ",5", "1,", "-3,5", "+2.000,01",
+              "1e3", "1,5e3", "inf", "nan", "abc", "1_000", "12.34.5", "1.000.000"]
+
+
+def german(x: float) -> str:
+    return f"{x:,.2f}".replace(",", "_").replace(".", ",").replace("_", ".")
+
+
+def sample(rows: int, number_format: str):
+    """Exchange-export-like column: prices with thousands separators, small amounts, repeats."""
+    rnd = random.Random(1)
+    values = []
+    for _ in range(rows):
+        x = rnd.choice((rnd.uniform(0.0001, 5), rnd.uniform(100, 120000), float(rnd.randint(1, 125))))
+        values.append(german(x) if number_format == "german" else f"{x:,.4f}")
+    return values
+
+
+def outcome(fn, s, number_format):
+    try:
+        return repr(fn(s, number_format))  # repr: nan == nan
+    except ValueError:
+        return "ValueError"
+
+
+def check(number_format: str, values):
+    for s in EDGE_CASES + values[:1000]:
+        old, new = outcome(parse_num_legacy, s, number_format), outcome(parse_num, s, number_format)
+        if old != new:
+            raise SystemExit(f"Mismatch for {s!r} ({number_format}): legacy {old}, new {new}")
+
+
+def best_of(fn, repeat: int = 5) -> float:
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t)
+    return min(times)
+
+
+def main(rows: int = 200_000):
+    for number_format in ("german", "us"):
+        values = sample(rows, number_format)
+        check(number_format, values)
+        legacy = best_of(lambda: [parse_num_legacy(s, number_format) for s in values])
+        single = best_of(lambda: [parse_num(s, number_format) for s in values])
+        many = best_of(lambda: parse_many(values, number_format))
+        print(f"{number_format:6} {rows} values: legacy {legacy * 1e3:7.1f} ms | parse_num {single * 1e3:7.1f} ms "
+              f"({legacy / single:.2f}x) | parse_many {many * 1e3:7.1f} ms ({legacy / many:.2f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
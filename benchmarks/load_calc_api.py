@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lastgenerator für POST /api/calc des lokalen Web-Servers (web_local.py)
+Startet den Server in einem eigenen Prozess (oder nutzt --url) und misst p50/p99
+bei 1, 16 und 128 gleichzeitigen Clients mit je einer Keep-Alive-Verbindung
+
+    python benchmarks/load_calc_api.py [--requests 200] [--clients 1 16 128] [--url http://host:port]
+"""
+
+import argparse, http.client, json, multiprocessing, os, socket, sys, threading, time
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PLANS = [
+    {"direction": "long", "entry_price": 65000.5, "max_loss": 10, "sl_percent": 1.0, "leverage": 10},
+    {"direction": "short", "entry_price": "3.450,25", "max_loss": "25", "sl_percent": "0,8", "leverage": 20,
+     "number_format": "german", "fee_tier": "binance/VIP0", "entry_side": "Maker", "tp_close": [50, 30, 20]},
+    {"direction": "long", "entry_price": 0.5321, "max_loss": 50, "sl_percent": 2.5, "leverage": 5,
+     "entry_fee": 0.02, "exit_fee": 0.05, "fees_in_risk": True, "liq_table": "binance/BTCUSDT"},
+]
+
+
+def _serve(port: int):
+    from web_local import make_server
+    make_server("127.0.0.1", port).serve_forever()
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_until_up(host: str, port: int, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            socket.create_connection((host, port), timeout=0.5).close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise SystemExit(f"Server on {host}:{port} did not come up.")
+            time.sleep(0.05)
+
+
+def client(host: str, port: int, n_requests: int, bodies, latencies: list, server_ms: list, errors: list, start: threading.Event):
+    """One keep-alive connection sending n_requests plans back to back."""
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    headers = {"Content-Type": "application/json"}
+    start.wait()
+    try:
+        for i in range(n_requests):
+            t = time.perf_counter()
+            conn.request("POST", "/api/calc", bodies[i % len(bodies)], headers)
+            resp = conn.getresponse()
+            resp.read()
+            latencies.append(time.perf_counter() - t)
+            if resp.status != 200:
+                errors.append(resp.status)
+            timing = resp.getheader("Server-Timing", "")
+            if "dur=" in timing:
+                server_ms.append(float(timing.split("dur=", 1)[1]))
+    except OSError as e:
+        errors.append(str(e))
+    finally:
+        conn.close()
+
+
+def percentile(sorted_values, p: float) -> float:
+    return sorted_values[min(int(len(sorted_values) * p), len(sorted_values) - 1)]
+
+
+def run(host: str, port: int, n_clients: int, n_requests: int):
+    bodies = [json.dumps(p).encode("utf-8") for p in PLANS]
+    latencies, server_ms, errors = [], [], []  # list.append is atomic under the GIL
+    start = threading.Event()
+    threads = [threading.Thread(target=client, args=(host, port, n_requests, bodies, latencies, server_ms, errors, start))
+               for _ in range(n_clients)]
+    for t in threads:
+        t.start()
+    time.sleep(0.2)  # let every client connect first
+    t0 = time.perf_counter()
+    start.set()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - t0
+    latencies.sort()
+    server_ms.sort()
+    print(f"{n_clients:4} clients x {n_requests} req: p50 {percentile(latencies, 0.50) * 1e3:7.2f} ms | "
+          f"p99 {percentile(latencies, 0.99) * 1e3:7.2f} ms | {len(latencies) / wall:8.0f} req/s | "
+          f"server p50 {percentile(server_ms, 0.50):.3f} ms" + (f" | {len(errors)} errors" if errors else ""))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--requests", type=int, default=200, help="requests per client")
+    ap.add_argument("--clients", type=int, nargs="+", default=[1, 16, 128])
+    ap.add_argument("--url", help="existing server, e.g. http://localhost:8080 (default: start one)")
+    args = ap.parse_args(argv)
+
+    server = None
+    if args.url:
+        parts = urlsplit(args.url)
+        host, port = parts.hostname, parts.port or 80
+    else:
+        host, port = "127.0.0.1", free_port()
+        server = multiprocessing.Process(target=_serve, args=(port,), daemon=True)
+        server.start()
+    try:
+        wait_until_up(host, port)
+        run(host, port, 1, 50)  # warm-up: imports, fee schedule, bracket tables
+        print("-" * 100)
+        for n in args.clients:
+            run(host, port, n, args.requests)
+    finally:
+        if server is not None:
+            server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Streaming-Client und Benchmark für POST /api/calc/batch (NDJSON rein, NDJSON raus)
+Sendet die Pläne chunked in einem Thread und liest die Ergebnisse gleichzeitig -
+weder Client noch Server halten Anfrage oder Antwort komplett im Speicher
+
+    python benchmarks/stream_batch.py [--plans 500000] [--in plans.ndjson] [--out results.ndjson] [--url http://host:port]
+"""
+
+import argparse, http.client, json, multiprocessing, os, random, socket, sys, threading, time
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from load_calc_api import _serve, free_port, wait_until_up
+
+
+def sample_plans(n: int):
+    """n generated plans as NDJSON lines, produced lazily."""
+    rnd = random.Random(1)
+    for i in range(n):
+        yield json.dumps({"id": i, "direction": rnd.choice(("long", "short")),
+                          "entry_price": round(rnd.uniform(100, 120000), 2), "max_loss": rnd.choice((10, 25, 50, 100)),
+                          "sl_percent": round(rnd.uniform(0.2, 5), 2), "leverage": rnd.randint(1, 50),
+                          "fee_tier": "binance/VIP0"}).encode("utf-8") + b"\n"
+
+
+def send_chunked(sock, lines, chunk_bytes: int = 64 * 1024):
+    """Request body as HTTP chunks of about chunk_bytes."""
+    buf, size = [], 0
+    for line in lines:
+        buf.append(line)
+        size += len(line)
+        if size >= chunk_bytes:
+            data = b"".join(buf)
+            sock.sendall(b"%x\r\n%s\r\n" % (len(data), data))
+            buf, size = [], 0
+    if buf:
+        data = b"".join(buf)
+        sock.sendall(b"%x\r\n%s\r\n" % (len(data), data))
+    sock.sendall(b"0\r\n\r\n")
+
+
+def stream_batch(host: str, port: int, lines, out=None):
+    """
+    Post NDJSON lines to /api/calc/batch and yield the result lines as they arrive.
+    Sending runs in its own thread: the server answers while it still reads, so a
+    client that sends everything first would deadlock once the socket buffers are full.
+    """
+    sock = socket.create_connection((host, port))
+    sock.sendall(f"POST /api/calc/batch HTTP/1.1\r\nHost: {host}:{port}\r\n"
+                 "Content-Type: application/x-ndjson\r\nTransfer-Encoding: chunked\r\n\r\n".encode("ascii"))
+    sender = threading.Thread(target=send_chunked, args=(sock, lines), daemon=True)
+    sender.start()
+    resp = http.client.HTTPResponse(sock, method="POST")
+    try:
+        resp.begin()
+        if resp.status != 200:
+            raise SystemExit(f"HTTP {resp.status}: {resp.read()[:200]!r}")
+        for line in iter(resp.readline, b""):
+            yield line
+        sender.join()
+    finally:
+        resp.close()
+        sock.close()
+
+
+def peak_rss_mb(pid: int = None) -> float:
+    """Peak resident memory (VmHWM) of a process on Linux, 0.0 elsewhere."""
+    try:
+        with open(f"/proc/{pid or 'self'}/status") as f:
+            return next(int(l.split()[1]) for l in f if l.startswith("VmHWM")) / 1024
+    except (OSError, StopIteration):
+        return 0.0
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--plans", type=int, default=500_000, help="generated plans (ignored with --in)")
+    ap.add_argument("--in", dest="in_path", help="NDJSON file of trade plans")
+    ap.add_argument("--out", dest="out_path", help="write the result lines here")
+    ap.add_argument("--url", help="existing server, e.g. http://localhost:8080 (default: start one)")
+    args = ap.parse_args(argv)
+
+    server = None
+    if args.url:
+        parts = urlsplit(args.url)
+        host, port = parts.hostname, parts.port or 80
+    else:
+        host, port = "127.0.0.1", free_port()
+        server = multiprocessing.Process(target=_serve, args=(port,), daemon=True)
+        server.start()
+    fin = open(args.in_path, "rb") if args.in_path else None
+    fout = open(args.out_path, "wb") if args.out_path else None
+    try:
+        wait_until_up(host, port)
+        started = time.perf_counter()
+        results = errors = 0
+        for line in stream_batch(host, port, fin if fin else sample_plans(args.plans)):
+            results += 1
+            errors += line.startswith(b'{"line":') or line.startswith(b'{"error":')
+            if fout:
+                fout.write(line)
+        seconds = time.perf_counter() - started
+        print(f"{results} results ({errors} errors) in {seconds:.1f} s = {results / seconds:,.0f} plans/s | "
+              f"peak RSS client {peak_rss_mb():.0f} MB" + (f", server {peak_rss_mb(server.pid):.0f} MB" if server else ""))
+    finally:
+        for f in (fin, fout):
+            if f:
+                f.close()
+        if server is not None:
+            server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ echo Installing PyInstaller...
 pip install pyinstaller pillow
 
 echo Building executable...
-pyinstaller --onefile --windowed --name "NominalwertRechner" --icon=logo.png nominalwert_rechner.py
+pyinstaller --onefile --windowed --name "NominalwertRechner" --icon=logo.png --add-data "maintenance_brackets.json;." --add-data "fee_schedule.json;." --add-data "locales;locales" nominalwert_rechner.py
 
 echo Done! Check the 'dist' folder for your executable.
 pause
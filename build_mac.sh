@@ -8,7 +8,7 @@ echo "Building macOS app..."
 pyinstaller --onefile --windowed --name "NominalwertRechner" nominalwert_rechner.py
 
 echo "Creating .app bundle..."
-pyinstaller --windowed --name "NominalwertRechner" --add-data "logo.png:." nominalwert_rechner.py
+pyinstaller --windowed --name "NominalwertRechner" --add-data "logo.png:." --add-data "maintenance_brackets.json:." --add-data "fee_schedule.json:." --add-data "locales:locales" nominalwert_rechner.py
 
 echo "Done! Check the 'dist' folder for:"
 echo "- NominalwertRechner (executable)"
@@ -44,6 +44,9 @@ pyinstaller --onefile \
     --name "NominalwertRechner" \
     --icon="logo.png" \
     --add-data "logo.png:." \
+    --add-data "maintenance_brackets.json:." \
+    --add-data "fee_schedule.json:." \
+    --add-data "locales:locales" \
     --hidden-import="PIL._tkinter_finder" \
     nominalwert_rechner.py
 
@@ -53,6 +56,9 @@ pyinstaller --windowed \
     --name "NominalwertRechner" \
     --icon="logo.png" \
     --add-data "logo.png:." \
+    --add-data "maintenance_brackets.json:." \
+    --add-data "fee_schedule.json:." \
+    --add-data "locales:locales" \
     --hidden-import="PIL._tkinter_finder" \
     nominalwert_rechner.py
 
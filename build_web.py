@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Build der Web-Versionen aus web/<seite>/page.html + style.css + app.js
+CSS und JS werden minifiziert und eingebettet, jede Ausgabe bekommt den Hash ihrer
+Quellen - unveränderte Seiten werden nicht neu geschrieben
+
+    python build_web.py [exact|standalone|local ...] [--force]
+"""
+
+import hashlib, os, re, sys, time
+from typing import Dict, List, Tuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+WEB_DIR = os.path.join(HERE, "web")
+
+# Source folder in web/ -> generated files next to this script
+PAGES: Dict[str, Tuple[str, ...]] = {
+    "exact": ("NominalwertRechner_Exact.html", "index.html"),  # release download and GitHub Pages
+    "standalone": ("NominalwertRechner.html",),
+    "local": ("nominalwert_rechner.html",),                    # web_local.py
+}
+
+STYLE_LINK = re.compile(r'<link rel="stylesheet" href="([^"]+)">')
+SCRIPT_SRC = re.compile(r'<script src="([^"]+)"></script>')
+STAMP = "<!-- build {} -->"
+
+
+def minify_css(css: str) -> str:
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def minify_js(js: str) -> str:
+    """Line based and conservative: indentation, blank lines and whole-line // comments go, line breaks stay (ASI)."""
+    lines = (line.strip() for line in js.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+def minify_html(html: str) -> str:
+    """Comments, indentation and blank lines - the pages have no <pre>/<textarea>."""
+    html = re.sub(r"<!--.*?-->", "", html, flags=re.S)
+    lines = (line.strip() for line in html.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def _sources(name: str) -> Tuple[str, Dict[str, str]]:
+    folder = os.path.join(WEB_DIR, name)
+    with open(os.path.join(folder, "page.html"), "r", encoding="utf-8") as f:
+        template = f.read()
+    files = {}
+    for ref in STYLE_LINK.findall(template) + SCRIPT_SRC.findall(template):
+        with open(os.path.join(folder, ref), "r", encoding="utf-8") as f:
+            files[ref] = f.read()
+    return template, files
+
+
+def source_hash(template: str, files: Dict[str, str]) -> str:
+    """Hash of everything that goes into a page, this builder included."""
+    h = hashlib.sha256()
+    with open(os.path.abspath(__file__), "rb") as f:
+        h.update(f.read())
+    for part in [template] + [x for ref in sorted(files) for x in (ref, files[ref])]:
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()[:16]
+
+
+def _stamped(path: str, digest: str) -> bool:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return STAMP.format(digest) in f.read(256)
+    except OSError:
+        return False
+
+
+def render_page(template: str, files: Dict[str, str], digest: str) -> str:
+    html = minify_html(template)
+    html = STYLE_LINK.sub(lambda m: f"<style>{minify_css(files[m.group(1)])}</style>", html)
+
+    def script(m):
+        js = minify_js(files[m.group(1)])
+        if "</script" in js:
+            raise ValueError(f"{m.group(1)} contains '</script' and can't be inlined.")
+        return f"<script>\n{js}\n</script>"
+    html = SCRIPT_SRC.sub(script, html)
+    doctype, _, rest = html.partition("\n")
+    return f"{doctype}\n{STAMP.format(digest)}\n{rest}\n"
+
+
+def build_page(name: str, force: bool = False, out_dir: str = HERE) -> List[str]:
+    """Build one page of PAGES; returns the files written ([] if all were up to date)."""
+    template, files = _sources(name)
+    digest = source_hash(template, files)
+    outputs = [os.path.join(out_dir, out) for out in PAGES[name]]
+    stale = [path for path in outputs if force or not _stamped(path, digest)]
+    if not stale:
+        return []
+    data = render_page(template, files, digest).encode("utf-8")
+    for path in stale:
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    return stale
+
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+    force = "--force" in args
+    names = [a for a in args if not a.startswith("--")] or list(PAGES)
+    unknown = [n for n in names if n not in PAGES]
+    if unknown:
+        raise SystemExit(f"Unknown page(s): {', '.join(unknown)} - choose from {', '.join(PAGES)}")
+    for name in names:
+        started = time.perf_counter()
+        written = build_page(name, force)
+        ms = (time.perf_counter() - started) * 1e3
+        if written:
+            sizes = ", ".join(f"{os.path.basename(p)} {os.path.getsize(p) / 1024:.1f} KB" for p in written)
+            print(f"✅ {name}: {sizes} ({ms:.1f} ms)")
+        else:
+            print(f"⏭️  {name}: unchanged ({ms:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gebühren-Staffeln (Börse → VIP-Stufe → Maker/Taker) für den Nominalwert-Rechner
+Einmal aus fee_schedule.json geladen, danach nur noch Dict-Lookups
+"""
+
+import os, sys
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Tuple
+
+# Next to the script, or inside the PyInstaller bundle
+FEES_PATH = os.path.join(getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__))), "fee_schedule.json")
+
+
+class FeeTier(NamedTuple):
+    """Fees of one exchange tier in % of nominal (negative maker = rebate)."""
+    exchange: str
+    tier: str
+    maker: float
+    taker: float
+    discount: float = 0.0    # % off positive fees, e.g. paying with BNB
+    discount_name: str = ""
+
+    @property
+    def name(self) -> str:
+        return f"{self.exchange}/{self.tier}"
+
+    def rate(self, side: str, discount: bool = False) -> float:
+        fee = self.maker if side == "maker" else self.taker
+        # Rebates are paid out in full, the token discount only reduces fees
+        return fee * (1.0 - self.discount / 100.0) if discount and fee > 0 else fee
+
+
+class FeeSchedule(NamedTuple):
+    tiers: Dict[str, FeeTier]                   # 'exchange/tier' -> tier
+    rates: Dict[Tuple[str, str, bool], float]   # ('exchange/tier', 'maker'|'taker', discount) -> fee %
+
+    def fee(self, tier: str, side: str, discount: bool = False) -> float:
+        """Fee % for a tier name and 'Maker'/'Taker' side - a single dict lookup."""
+        try:
+            return self.rates[(tier, side.lower(), bool(discount))]
+        except KeyError:
+            if tier not in self.tiers:
+                raise ValueError(f"Unknown fee tier {tier!r}.") from None
+            raise ValueError(f"Side must be Maker or Taker, got {side!r}.") from None
+
+    def names(self) -> List[str]:
+        return sorted(self.tiers)
+
+
+@lru_cache(maxsize=4)
+def load_fee_schedule(path: str = FEES_PATH) -> FeeSchedule:
+    """Read the JSON schedule once and precompute every (tier, side, discount) rate."""
+    import json  # lazy: keeps importing the engine modules cheap
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    tiers = {}
+    for exchange, spec in data.items():
+        if exchange.startswith("_"):
+            continue
+        for tier, fees in spec["tiers"].items():
+            t = FeeTier(exchange, tier, float(fees["maker"]), float(fees["taker"]),
+                        float(spec.get("discount", 0.0)), spec.get("discount_name", ""))
+            tiers[t.name] = t
+    rates = {(name, side, discount): t.rate(side, discount)
+             for name, t in tiers.items() for side in ("maker", "taker") for discount in (False, True)}
+    return FeeSchedule(tiers, rates)
+
+
+def tier_fees(schedule: FeeSchedule, tiers, sides, discount: bool = False):
+    """
+    Fee % column for columns (or scalars) of tier names and 'Maker'/'Taker' sides,
+    e.g. as entry_fee/exit_fee input of calculate_batch.
+    """
+    if isinstance(tiers, str) and isinstance(sides, str):
+        return schedule.fee(tiers, sides, discount)
+    n = len(tiers) if not isinstance(tiers, str) else len(sides)
+    tiers = [tiers] * n if isinstance(tiers, str) else tiers
+    sides = [sides] * n if isinstance(sides, str) else sides
+    if len(tiers) != len(sides):
+        raise ValueError(f"Column length mismatch: {len(sides)} != {len(tiers)}.")
+    fee = schedule.fee
+    return [fee(t, s, discount) for t, s in zip(tiers, sides)]
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Liquidationspreis-Rechner für isolierte Positionen
+Maintenance-Margin Staffeln (Brackets) pro Börse/Symbol aus maintenance_brackets.json
+"""
+
+import os, sys
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+from position_engine import BATCH_NUMPY_MIN_ROWS, PositionResult, _at, _batch_len, _direction_sign, _numpy, normalize_direction
+
+# Next to the script, or inside the PyInstaller bundle
+BRACKETS_PATH = os.path.join(getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__))),
+                             "maintenance_brackets.json")
+DEFAULT_BRACKET_TABLE = "binance/BTCUSDT"
+
+
+class Bracket(NamedTuple):
+    """One maintenance-margin tier: applies to notionals above floor (mmr in %)."""
+    floor: float
+    max_leverage: float
+    mmr: float
+    maint_amount: float  # cumulative deduction, keeps the maintenance margin continuous across tiers
+
+
+class BracketTable(NamedTuple):
+    name: str
+    floors: Tuple[float, ...]  # sorted - the bisect index
+    brackets: Tuple[Bracket, ...]
+
+    def bracket_for(self, notional: float) -> Bracket:
+        """Tier of a position notional (floor < notional <= next floor)."""
+        return self.brackets[max(bisect_left(self.floors, notional) - 1, 0)]
+
+
+class LiquidationResult(NamedTuple):
+    liq_price: float       # 0.0 if the position cannot be liquidated (long without leverage)
+    mmr: float             # maintenance margin rate in %
+    maint_margin: float
+    max_leverage: float    # highest leverage the exchange allows for this notional
+    leverage_ok: bool
+    sl_beyond_liq: bool    # stop-loss would only trigger after liquidation
+
+
+def _table_from_rows(name: str, rows: Sequence[dict]) -> BracketTable:
+    brackets: List[Bracket] = []
+    maint_amount = 0.0
+    for row in sorted(rows, key=lambda r: float(r["floor"])):
+        floor, mmr = float(row["floor"]), float(row["mmr"])
+        if brackets:
+            maint_amount += floor * (mmr - brackets[-1].mmr) / 100.0
+        brackets.append(Bracket(floor, float(row["max_leverage"]), mmr, maint_amount))
+    if not brackets or brackets[0].floor != 0:
+        raise ValueError(f"Bracket table {name} must start at notional 0.")
+    return BracketTable(name, tuple(b.floor for b in brackets), tuple(brackets))
+
+
+@lru_cache(maxsize=4)
+def load_brackets(path: str = BRACKETS_PATH) -> Dict[str, BracketTable]:
+    """All bracket tables of a JSON file, keyed 'exchange/SYMBOL'. Loaded once per path."""
+    import json  # lazy: keeps importing the engine modules cheap
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {f"{exchange}/{symbol}": _table_from_rows(f"{exchange}/{symbol}", rows)
+            for exchange, symbols in data.items() if not exchange.startswith("_")
+            for symbol, rows in symbols.items()}
+
+
+def bracket_table(name: str = DEFAULT_BRACKET_TABLE, path: str = BRACKETS_PATH) -> BracketTable:
+    try:
+        return load_brackets(path)[name]
+    except KeyError:
+        raise ValueError(f"Unknown bracket table {name!r}.") from None
+
+
+def liquidation_price(direction: str, entry_price: float, nominal: float, leverage: float,
+                      table: BracketTable, sl_price: float = None) -> LiquidationResult:
+    """
+    Liquidation price of an isolated position whose margin is nominal / leverage.
+
+    The position is liquidated when margin + unrealized P&L falls to the
+    maintenance margin (notional * mmr - maint_amount, tier picked by the entry
+    notional). Same as the exchanges' isolated-margin formula without other positions.
+    """
+    direction = normalize_direction(direction)
+    if entry_price <= 0: raise ValueError("Entry price must be > 0.")
+    if nominal <= 0:     raise ValueError("Nominal must be > 0.")
+    b = table.bracket_for(nominal)
+    units = nominal / entry_price
+    margin = nominal / leverage
+    mmr = b.mmr / 100.0
+    if direction == "long":
+        liq = max((nominal - margin - b.maint_amount) / (units * (1.0 - mmr)), 0.0)
+        beyond = sl_price is not None and sl_price <= liq
+    else:
+        liq = (nominal + margin + b.maint_amount) / (units * (1.0 + mmr))
+        beyond = sl_price is not None and sl_price >= liq
+    return LiquidationResult(liq, b.mmr, nominal * mmr - b.maint_amount, b.max_leverage,
+                             leverage <= b.max_leverage, beyond)
+
+
+def liquidation_for(res: PositionResult, table: BracketTable) -> LiquidationResult:
+    """Liquidation check of a calculate_position result (SL included)."""
+    return liquidation_price(res.direction, res.entry_price, res.nominal, res.leverage, table, res.sl_price)
+
+
+LIQUIDATION_COLUMNS = ("liq_price", "mmr", "maint_margin", "max_leverage", "leverage_ok", "sl_beyond_liq")
+
+
+def liquidation_batch(direction, entry_price, nominal, leverage, sl_price, table: BracketTable,
+                      use_numpy=None) -> Dict[str, Sequence]:
+    """
+    Liquidation screening for many setups, e.g. the nominal/sl_price columns of
+    calculate_batch. Scalars broadcast. With NumPy the tiers are looked up with
+    searchsorted in one pass; otherwise bisect per row. Both give the same numbers.
+    """
+    n = _batch_len([direction, entry_price, nominal, leverage, sl_price])
+    if use_numpy is None:
+        use_numpy = n >= BATCH_NUMPY_MIN_ROWS and _numpy() is not None
+    if use_numpy:
+        if _numpy() is None:
+            raise RuntimeError("use_numpy=True needs NumPy installed.")
+        return _liquidation_batch_numpy(n, direction, entry_price, nominal, leverage, sl_price, table)
+
+    out = {col: [] for col in LIQUIDATION_COLUMNS}
+    for i in range(n):
+        try:
+            liq = liquidation_price(_at(direction, i), _at(entry_price, i), _at(nominal, i), _at(leverage, i),
+                                    table, _at(sl_price, i))
+        except (ValueError, ZeroDivisionError) as e:
+            raise ValueError(f"Row {i}: {e}") from None
+        for col, value in zip(LIQUIDATION_COLUMNS, liq):
+            out[col].append(value)
+    return out
+
+
+def _liquidation_batch_numpy(n, direction, entry_price, nominal, leverage, sl_price, table):
+    np = _numpy()
+    sign = _direction_sign(direction, n)
+    entry_price, nominal, leverage, sl_price = (np.broadcast_to(np.asarray(c, dtype=float), (n,))
+                                                for c in (entry_price, nominal, leverage, sl_price))
+    if (entry_price <= 0).any():
+        raise ValueError(f"Row {int(np.argmax(entry_price <= 0))}: Entry price must be > 0.")
+    if (nominal <= 0).any():
+        raise ValueError(f"Row {int(np.argmax(nominal <= 0))}: Nominal must be > 0.")
+    tier = np.maximum(np.searchsorted(np.asarray(table.floors), nominal, side="left") - 1, 0)
+    mmr_pct = np.array([b.mmr for b in table.brackets])[tier]
+    maint_amount = np.array([b.maint_amount for b in table.brackets])[tier]
+    max_leverage = np.array([b.max_leverage for b in table.brackets])[tier]
+
+    units = nominal / entry_price
+    margin = nominal / leverage
+    mmr = mmr_pct / 100.0
+    is_long = sign > 0
+    liq = np.where(is_long,
+                   np.maximum((nominal - margin - maint_amount) / (units * (1.0 - mmr)), 0.0),
+                   (nominal + margin + maint_amount) / (units * (1.0 + mmr)))
+    return {
+        "liq_price": liq,
+        "mmr": mmr_pct,
+        "maint_margin": nominal * mmr - maint_amount,
+        "max_leverage": max_leverage,
+        "leverage_ok": leverage <= max_leverage,
+        "sl_beyond_liq": np.where(is_long, sl_price <= liq, sl_price >= liq),
+    }
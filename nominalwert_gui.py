@@ -0,0 +1,1696 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tkinter-Oberfläche des Nominalwert-Rechners
+Wird erst beim Start der GUI importiert - Rechen- und Formatfunktionen bleiben in nominalwert_rechner
+"""
+
+import os, sys, csv, time, tempfile, tkinter as tk
+from tkinter import ttk, messagebox, filedialog, font as tkfont
+from typing import NamedTuple
+
+from position_engine import (DEFAULT_TP_R, DEFAULT_TP_PERCENT, MAX_TP_LEVELS, IncrementalPosition, TPLevel,
+                             blend_tp_exits, calculate_ladder, leverage_sweep, sl_range)
+from liquidation import DEFAULT_BRACKET_TABLE, bracket_table, liquidation_for, load_brackets
+from fee_schedule import load_fee_schedule
+from nominalwert_rechner import (LIVE_RECALC_DELAY_MS, NUMBER_LOCALES, TIMING_REPORT, SettingsStore, appdata_dir,
+                                 csv_delimiter, fmt_money, fmt_num, format_column, get_text, parse_num, texts, tp_title,
+                                 available_languages)
+
+# ---------------- Logo ----------------
+LOGO_NAMES = ("wundaguad_logo.png", "wundaguad.png", "WUNDAGUAD.png", "logo.png")
+LOGO_HEIGHT = 20  # px, fits the credit line
+
+def find_logo():
+    """First logo file in the working dir, next to the script or in the PyInstaller bundle."""
+    here = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+    for name in LOGO_NAMES:
+        for path in (name, os.path.join(here, name)):
+            if os.path.isfile(path):
+                return path
+    return None
+
+def cached_logo(height: int = LOGO_HEIGHT):
+    """
+    Path of a PNG of the logo already scaled to height, for tk.PhotoImage.
+    The cache file is keyed by the source's mtime and size, so PIL is only
+    imported when the logo changed or on the very first start. None if there
+    is no logo or it can't be scaled.
+    """
+    src = find_logo()
+    if src is None:
+        return None
+    st = os.stat(src)
+    cache_dir = appdata_dir()
+    cached = os.path.join(cache_dir, f"logo_{height}_{st.st_mtime_ns}_{st.st_size}.png")
+    if os.path.isfile(cached):
+        return cached
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    with Image.open(src) as img:
+        width = int(img.width * (height / img.height))
+        scaled = img.resize((width, height), Image.Resampling.LANCZOS)
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".png")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            scaled.save(f, format="PNG")
+        os.replace(tmp, cached)
+    except Exception:
+        os.unlink(tmp)
+        raise
+    for name in os.listdir(cache_dir):  # drop logos cached for an older source file
+        if name.startswith("logo_") and name.endswith(".png") and os.path.join(cache_dir, name) != cached:
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass
+    return cached
+
+# ---------------- UI: Collapsible section ----------------
+class Collapsible(ttk.Frame):
+    def __init__(self, parent, title: str, initially_open: bool = False, build=None):
+        super().__init__(parent)
+        self._open = initially_open
+        self._title = title
+        self._build = build  # build(body) fills the body on first expand - a collapsed section costs one button
+        self.header = ttk.Button(self, text=self._title_text(), command=self._toggle, style="TButton")
+        self.header.grid(row=0, column=0, sticky="ew")
+        self.body = ttk.Frame(self, style="Card.TFrame")
+        if self._open:
+            self._show()
+
+    def _title_text(self):
+        return f"{'▼' if self._open else '▶'}  {self._title}"
+
+    def _toggle(self):
+        self._open = not self._open
+        self.header.config(text=self._title_text())
+        if self._open:
+            self._show()
+        else:
+            self.body.grid_remove()
+
+    def _show(self):
+        if self._build is not None:
+            build, self._build = self._build, None
+            build(self.body)
+        self.body.grid(row=1, column=0, sticky="ew", pady=(6, 4))
+
+# ---------------- Fonts & scaling ----------------
+FONT_FAMILY = "Segoe UI"
+FONT_MIN_SIZE = 2
+# Role -> (size at zoom 1.0, weight). Widgets and styles share one Font object per role.
+FONT_ROLES = {
+    "entry": (7, "normal"),        # small entries/comboboxes in the collapsible sections
+    "entry_bold": (7, "bold"),     # TP ladder labels
+    "small": (8, "normal"),        # credits, hints
+    "label": (8, "bold"),          # form labels in the collapsible sections
+    "body": (9, "normal"),         # TLabel, TButton, P&L text
+    "body_bold": (9, "bold"),      # result row labels, table headings
+    "button": (10, "normal"),      # copy/modern buttons, comboboxes
+    "button_bold": (10, "bold"),
+    "input": (11, "normal"),       # main input fields
+    "heading": (11, "bold"),       # card headings, main field labels, result values
+    "direction": (12, "normal"),   # Long/Short radio buttons
+    "section": (12, "bold"),
+    "title": (14, "bold"),
+    "icon": (16, "normal"),
+    "title_large": (16, "bold"),
+    "large": (20, "bold"),         # leverage display
+}
+
+class FontRegistry:
+    """
+    Named Tk fonts by role. A zoom reconfigures each font once - always from
+    its base size, so repeated zooms never compound - and Tk reflows every
+    widget using it, without walking the widget tree.
+    """
+
+    def __init__(self, root):
+        self.zoom = 1.0
+        self._fonts = {role: tkfont.Font(root, family=FONT_FAMILY, size=size, weight=weight)
+                       for role, (size, weight) in FONT_ROLES.items()}
+
+    def __getitem__(self, role: str) -> tkfont.Font:
+        return self._fonts[role]
+
+    def set_zoom(self, zoom: float) -> int:
+        """Scale all fonts to zoom x base size. Returns the number of fonts reconfigured (0 if unchanged)."""
+        if zoom == self.zoom:
+            return 0
+        for role, font in self._fonts.items():
+            font.configure(size=max(FONT_MIN_SIZE, int(FONT_ROLES[role][0] * zoom)))
+        self.zoom = zoom
+        return len(self._fonts)
+
+def scale_option(value, zoom):
+    """Scale a width/padding option value (int or sequence of ints); None if it has no size."""
+    if isinstance(value, (int, float)):
+        return max(1, int(value * zoom)) if value > 0 else None
+    try:
+        values = [int(str(v)) for v in value]
+    except (TypeError, ValueError):
+        return None
+    return [max(1, int(v * zoom)) for v in values] if values else None
+
+class ScaleTransaction:
+    """
+    Property changes of one zoom pass. Nothing touches Tk until commit(), which
+    issues one configure per widget (last value per option wins) and one idle
+    flush, instead of a redraw per visited widget.
+    """
+
+    def __init__(self):
+        self._widgets = {}
+
+    def configure(self, widget, **options):
+        self._widgets.setdefault(widget, {}).update(options)
+
+    def commit(self, root) -> int:
+        """Apply all collected changes. Returns the number of Tk calls issued."""
+        calls = 0
+        for widget, options in self._widgets.items():
+            widget.configure(**options)
+            calls += 1
+        self._widgets.clear()
+        root.update_idletasks()
+        return calls + 1
+
+# ---------------- App ----------------
+class ResultRow(NamedTuple):
+    """Widgets of one result row, registered under its value key ('nominal', 'tp2', ...)."""
+    key: str
+    title: ttk.Label
+    frame: ttk.Frame
+    label: ttk.Label
+    button: ttk.Button
+
+class RoundedButton(tk.Canvas):
+    def __init__(self, parent, text, command, bg_color, fg_color="black", hover_color=None, font=("Segoe UI", 10), width=100, height=30, corner_radius=15):
+        super().__init__(parent, width=width, height=height, highlightthickness=0, relief="flat")
+        self.command = command
+        self.bg_color = bg_color
+        self.fg_color = fg_color
+        self.hover_color = hover_color or bg_color
+        self.font = font
+        self.text = text
+        self.corner_radius = corner_radius
+        self.width = width
+        self.height = height
+        
+        try:
+            parent_bg = parent.cget('bg')
+        except:
+            parent_bg = '#2b2b2b'
+        self.config(bg=parent_bg)
+        
+        self.draw_button()
+        self.bind("<Button-1>", self.on_click)
+        self.bind("<Enter>", self.on_enter)
+        self.bind("<Leave>", self.on_leave)
+        
+    def draw_button(self, color=None):
+        self.delete("all")
+        color = color or self.bg_color
+        
+        # Draw clean rounded rectangle using ovals
+        x1, y1 = 0, 0
+        x2, y2 = self.width, self.height
+        r = min(self.corner_radius, self.width//2, self.height//2)
+        
+        # Main rectangle body
+        self.create_rectangle(x1 + r, y1, x2 - r, y2, fill=color, outline="")
+        self.create_rectangle(x1, y1 + r, x2, y2 - r, fill=color, outline="")
+        
+        # Corner circles for smooth rounded corners
+        self.create_oval(x1, y1, x1 + 2*r, y1 + 2*r, fill=color, outline="")  # Top-left
+        self.create_oval(x2 - 2*r, y1, x2, y1 + 2*r, fill=color, outline="")  # Top-right
+        self.create_oval(x1, y2 - 2*r, x1 + 2*r, y2, fill=color, outline="")  # Bottom-left
+        self.create_oval(x2 - 2*r, y2 - 2*r, x2, y2, fill=color, outline="")  # Bottom-right
+        
+        # Add text
+        self.create_text(self.width//2, self.height//2, text=self.text, fill=self.fg_color, font=self.font)
+        
+    def on_click(self, event):
+        if self.command:
+            self.command()
+            
+    def on_enter(self, event):
+        self.draw_button(self.hover_color)
+        
+    def on_leave(self, event):
+        self.draw_button()
+
+class NominalwertRechner(tk.Tk):
+    def __init__(self):
+        started = time.perf_counter()
+        super().__init__()
+        self.settings = SettingsStore()
+        self.current_language = self.settings.get("language", "german")
+        self.texts = texts(self.current_language)  # precompiled templates of the P&L lines
+        self.title(get_text("title", self.current_language))
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self._last_values = {}       # key -> text on screen; rendering skips Tk calls for unchanged text
+        self._margin_preview = None  # (sweep grid, sl_percent, number_format) of the last calculation
+        self._last_result = None     # PositionResult of the last calculation, for format-only re-renders
+        self._live = None            # IncrementalPosition for live recalculation while typing
+        self._extra_lines = []       # P&L text lines, updated line by line
+        self._pending_inputs = set()
+        self._recalc_after_id = None
+        self._tp_fractions = ()      # close fraction per TP level of the last calculation
+        self.tp_rows = []            # (r, %, close-%) StringVars per TP level
+        self.tp_widgets = []         # (label, r entry, % entry, close entry) per level, once the TP section is built
+        self.result_rows = {}        # value key -> ResultRow, filled by _add_result_row
+        self._copy_reset_ids = {}    # value key -> after id that puts the copy button's 📋 back
+        self._zoom_base = {}         # (widget, option) -> size at zoom 1.0
+        self.zoom_stats = None       # Tk calls and ms of the last zoom
+        self.startup_stats = {"deferred": {}}  # ms of the startup phases and of sections built on first expand
+        
+        # --------- Modern Professional Theme ----------
+        # Fixed width, variable height window
+        screen_width = self.winfo_screenwidth()
+        screen_height = self.winfo_screenheight()
+        
+        # Increase width to prevent clipping
+        window_width = 400  # Increased from 367 to fit all content
+        window_height = min(689, int(screen_height * 0.85))  # 810 * 0.85 = 688.5 ≈ 689
+        
+        # Center window on screen
+        x = (screen_width - window_width) // 2
+        y = (screen_height - window_height) // 2
+        
+        self.geometry("400x689")  # Wider to prevent clipping
+        self.minsize(400, 383)  # 450 * 0.85 = 382.5 ≈ 383
+        self.maxsize(400, 918)  # 1080 * 0.85 = 918
+        self.resizable(False, True)  # Only vertical resize
+        
+        style = ttk.Style(self)
+        self.fonts = FontRegistry(self)
+        try:
+            style.theme_use("clam")
+        except Exception:
+            pass
+        
+        # Modern Color Palette - Black & Neon Yellow
+        BG = "#121212"          # Black background
+        CARD = "#1E1E1E"        # Dark card background
+        SURFACE = "#2A2A2A"     # Surface elements
+        PRIMARY = "#C9F24A"     # Neon yellow primary
+        SECONDARY = "#FF6B6B"   # Coral secondary
+        SUCCESS = "#4ECDC4"     # Teal success
+        WARNING = "#FFE66D"     # Yellow warning
+        DANGER = "#FF4757"      # Red for SL
+        PROFIT = "#2ED573"      # Green for TP
+        TEXT = "#EAEAEA"        # Light text
+        TEXT_MUTED = "#A0A0A0"  # Muted text
+        BORDER = "#333333"      # Subtle borders
+        self.tp_result_color = PROFIT  # TP result rows are added later (_sync_tp_result_rows)
+
+        self.configure(bg=BG)
+        
+        # Configure styles - all 10% smaller
+        style.configure("TLabel", background=BG, foreground=TEXT, font=self.fonts["body"])  # was 10
+        style.configure("TFrame", background=BG)
+        style.configure("TButton", background=SURFACE, foreground=TEXT, borderwidth=0, focuscolor="none", font=self.fonts["body"])  # was 10
+        style.map("TButton", background=[("active", PRIMARY), ("pressed", PRIMARY)], foreground=[("active", "black"), ("pressed", "black")])
+        style.configure("TEntry", fieldbackground=SURFACE, foreground=TEXT, bordercolor=BORDER, insertcolor=TEXT, font=self.fonts["small"])  # was 9
+        style.configure("TCombobox", fieldbackground=SURFACE, foreground=TEXT, bordercolor=BORDER, font=self.fonts["small"])  # was 9
+        style.configure("TScale", background=BG, troughcolor=SURFACE, borderwidth=0)
+        style.configure("TRadiobutton", background=BG, foreground=TEXT, focuscolor="none", font=self.fonts["body"])  # was 10
+        style.map("TRadiobutton", background=[("active", BG)], foreground=[("active", TEXT)])
+        style.configure("Surface.TFrame", background=BG, relief="flat", borderwidth=0)
+        
+        # Rounded button style - compact
+        style.configure("Rounded.TButton", 
+                       background=SURFACE, 
+                       foreground=TEXT, 
+                       borderwidth=1,
+                       relief="solid",
+                       bordercolor=BORDER,
+                       focuscolor="none",
+                       padding=(8, 4),
+                       font=self.fonts["body"])
+        style.map("Rounded.TButton", 
+                 background=[("active", PRIMARY), ("pressed", PRIMARY)], 
+                 foreground=[("active", "black"), ("pressed", "black")],
+                 bordercolor=[("active", PRIMARY), ("pressed", PRIMARY)])
+        
+        # Rounded Primary Button (Calculate)
+        style.configure("Primary.TButton", 
+                       background=PRIMARY, 
+                       foreground="black", 
+                       borderwidth=1,
+                       relief="solid",
+                       bordercolor=PRIMARY,
+                       focuscolor="none",
+                       padding=(12, 8),
+                       font=self.fonts["heading"],
+                       compound="center")
+        style.map("Primary.TButton", 
+                 background=[("active", "#00E676"), ("pressed", "#00C853")],
+                 bordercolor=[("active", "#00E676"), ("pressed", "#00C853")])
+        
+        # Rounded Copy button styles
+        style.configure("Success.Copy.TButton", 
+                       background=SUCCESS, 
+                       foreground="black", 
+                       borderwidth=1,
+                       relief="solid",
+                       bordercolor=SUCCESS,
+                       focuscolor="none",
+                       padding=(8, 6),
+                       font=self.fonts["button"],
+                       compound="center")
+        style.map("Success.Copy.TButton", 
+                 background=[("active", "#26D0CE"), ("pressed", "#1BA3A0")],
+                 bordercolor=[("active", "#26D0CE"), ("pressed", "#1BA3A0")])
+        
+        style.configure("Warning.Copy.TButton", 
+                       background=WARNING, 
+                       foreground="black", 
+                       borderwidth=1,
+                       relief="solid",
+                       bordercolor=WARNING,
+                       focuscolor="none",
+                       padding=(8, 6),
+                       font=self.fonts["button"],
+                       compound="center")
+        style.map("Warning.Copy.TButton", 
+                 background=[("active", "#FFE066"), ("pressed", "#e2ff00")],
+                 bordercolor=[("active", "#FFE066"), ("pressed", "#e2ff00")])
+        
+        style.configure("Danger.Copy.TButton", 
+                       background=DANGER, 
+                       foreground="white", 
+                       borderwidth=1,
+                       relief="solid",
+                       bordercolor=DANGER,
+                       focuscolor="none",
+                       padding=(8, 6),
+                       font=self.fonts["button"],
+                       compound="center")
+        style.map("Danger.Copy.TButton", 
+                 background=[("active", "#FF6B7A"), ("pressed", "#FF3742")],
+                 bordercolor=[("active", "#FF6B7A"), ("pressed", "#FF3742")])
+        
+        style.configure("Profit.Copy.TButton", 
+                       background=PROFIT, 
+                       foreground="black", 
+                       borderwidth=1,
+                       relief="solid",
+                       bordercolor=PROFIT,
+                       focuscolor="none",
+                       padding=(8, 6),
+                       font=self.fonts["button"],
+                       compound="center")
+        style.map("Profit.Copy.TButton", 
+                 background=[("active", "#4AE584"), ("pressed", "#1ED760")],
+                 bordercolor=[("active", "#4AE584"), ("pressed", "#1ED760")])
+        
+        # Entry styles
+        style.configure("TEntry", 
+                       fieldbackground=SURFACE, 
+                       foreground=TEXT, 
+                       borderwidth=2,
+                       relief="flat",
+                       insertcolor=PRIMARY,
+                       font=self.fonts["input"])
+        style.map("TEntry", 
+                 focuscolor=[("focus", PRIMARY)],
+                 bordercolor=[("focus", PRIMARY), ("!focus", BORDER)])
+        
+        # Button styles
+        style.configure("Modern.TButton",
+                       background=SURFACE,
+                       foreground=TEXT,
+                       borderwidth=2,
+                       relief="flat",
+                       padding=(12, 8),
+                       font=self.fonts["button"])
+        style.map("Modern.TButton",
+                 background=[("active", BORDER), ("pressed", PRIMARY)],
+                 foreground=[("active", "#000"), ("pressed", "#000")],
+                 bordercolor=[("focus", PRIMARY), ("!focus", BORDER)])
+        
+        style.configure("Primary.TButton",
+                       background=PRIMARY,
+                       foreground="#000",
+                       borderwidth=0,
+                       relief="flat",
+                       padding=(16, 12),
+                       font=self.fonts["heading"])
+        style.map("Primary.TButton",
+                 background=[("active", "#00B8E6"), ("pressed", "#0099CC")],
+                 foreground=[("active", "#000"), ("pressed", "#000")])
+        
+        style.configure("Success.TButton",
+                       background=SUCCESS,
+                       foreground="#000",
+                       borderwidth=0,
+                       relief="flat",
+                       padding=(8, 6),
+                       font=self.fonts["body"])
+        style.map("Success.TButton",
+                 background=[("active", "#45B7B8")],
+                 foreground=[("active", "#000")])
+        
+        # TP (Profit) and SL (Danger) button styles
+        style.configure("Profit.TButton",
+                       background=PROFIT,
+                       foreground="#000",
+                       borderwidth=0,
+                       relief="flat",
+                       padding=(8, 6),
+                       font=self.fonts["body"])
+        style.map("Profit.TButton",
+                 background=[("active", "#26C653")],
+                 foreground=[("active", "#000")])
+        
+        style.configure("Danger.TButton",
+                       background=DANGER,
+                       foreground="#FFF",
+                       borderwidth=0,
+                       relief="flat",
+                       padding=(8, 6),
+                       font=self.fonts["body"])
+        style.map("Danger.TButton",
+                 background=[("active", "#E73C3C")],
+                 foreground=[("active", "#FFF")])
+        
+        # Combobox styles - Fix readability
+        style.configure("TCombobox",
+                       fieldbackground=SURFACE,
+                       foreground=TEXT,
+                       background=SURFACE,
+                       selectbackground=PRIMARY,
+                       selectforeground="#000",
+                       borderwidth=2,
+                       relief="flat",
+                       font=self.fonts["button"])
+        style.map("TCombobox",
+                 focuscolor=[("focus", PRIMARY)],
+                 bordercolor=[("focus", PRIMARY), ("!focus", BORDER)],
+                 fieldbackground=[("readonly", SURFACE)],
+                 foreground=[("readonly", TEXT)])
+        
+        # Scale styles
+        style.configure("Modern.Horizontal.TScale",
+                       background=BG,
+                       troughcolor=SURFACE,
+                       borderwidth=0,
+                       lightcolor=PRIMARY,
+                       darkcolor=PRIMARY)
+        
+        # Title and Heading styles - 10% smaller
+        style.configure("Title.TLabel", 
+                       font=self.fonts["title_large"],  # was 18
+                       background=BG, 
+                       foreground=TEXT)
+        
+        style.configure("Heading.TLabel", 
+                       font=self.fonts["heading"],  # was 12
+                       background=BG, 
+                       foreground=TEXT)
+        
+        # Labelframe styles
+        style.configure("Modern.TLabelframe",
+                       background=CARD,
+                       borderwidth=2,
+                       relief="flat",
+                       bordercolor=BORDER)
+        style.configure("Modern.TLabelframe.Label",
+                       background=CARD,
+                       foreground=PRIMARY,
+                       font=self.fonts["heading"])
+
+        # Create scrollable main container with padding
+        main_canvas = tk.Canvas(self, bg=BG, highlightthickness=0)
+        scrollable_frame = ttk.Frame(main_canvas, style="TFrame")
+        
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: main_canvas.configure(scrollregion=main_canvas.bbox("all"))
+        )
+        
+        main_canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        
+        main_canvas.pack(fill="both", expand=True, padx=6, pady=6)  # Centered padding
+        
+        # Enable smooth mouse wheel scrolling
+        def _on_mousewheel(event):
+            # Smooth scrolling with smaller increments
+            main_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        
+        # Bind scrolling to the entire window, not just canvas
+        self.bind_all("<MouseWheel>", _on_mousewheel)
+        
+        # Also bind to canvas for redundancy
+        main_canvas.bind("<MouseWheel>", _on_mousewheel)
+        
+        # Set focus to canvas so it can receive scroll events immediately
+        main_canvas.focus_set()
+        
+        # Add scroll indicator
+        self.create_scroll_indicator(main_canvas)
+        
+        main = ttk.Frame(scrollable_frame, padding=6, style="TFrame")  # Centered padding
+        main.pack(fill="both", expand=True)
+        
+        # Store references for scaling
+        self.main_frame = main
+        self.main_canvas = main_canvas
+        self.scrollable_frame = scrollable_frame
+        
+        # No window resize handling needed for fixed width
+        
+        # Title Section
+        title_frame = ttk.Frame(main, style="TFrame")
+        title_frame.pack(fill="x", pady=(0, 8))
+        
+        # Main title - smaller
+        ttk.Label(title_frame, text=get_text("title", self.current_language), font=self.fonts["title"], foreground="#e2ff00").pack()
+        
+        # Colorful WUNDAGUAD credit line
+        credit_frame = ttk.Frame(title_frame, style="TFrame")
+        credit_frame.pack(pady=(4, 0))
+        
+        # Create credit line with image
+        ttk.Label(credit_frame, text="Created with ", font=self.fonts["small"], foreground="#9598a1").pack(side="left")
+        ttk.Label(credit_frame, text="♥", font=self.fonts["icon"], foreground="#FF0000").pack(side="left")  # Red heart - bigger
+        ttk.Label(credit_frame, text=" by ", font=self.fonts["small"], foreground="#9598a1").pack(side="left")
+        
+        # WUNDAGUAD logo - filled in once the window is on screen (see _on_first_map)
+        self.logo_slot = ttk.Frame(credit_frame, style="TFrame")
+        self.logo_slot.pack(side="left")
+        self._first_map_seen = False
+        self.bind("<Map>", self._on_first_map, add="+")
+        
+        ttk.Label(credit_frame, text=" for our community", font=self.fonts["small"], foreground="#9598a1").pack(side="left")
+        
+        # Main Input Card - larger padding for bigger section
+        input_card = ttk.Frame(main, style="Card.TFrame", padding=10)  # Increased from 6 to 10
+        input_card.pack(fill="x", pady=(0, 6))  # Increased from 4 to 6
+        
+        # Header with title and reset button
+        header_frame = ttk.Frame(input_card, style="Card.TFrame")
+        header_frame.pack(fill="x", pady=(0, 8))
+        
+        ttk.Label(header_frame, text=get_text("basic_settings", self.current_language), font=self.fonts["section"], foreground="#e2ff00").pack(side="left")
+        
+        # Reset button
+        reset_btn = ttk.Button(header_frame, text="🔄 Reset", style="Action.TButton", command=self.reset_inputs)
+        reset_btn.pack(side="right", padx=(10, 0))
+        
+        # Grid for inputs
+        input_grid = ttk.Frame(input_card, style="Card.TFrame")
+        input_grid.pack(fill="x")
+        input_grid.columnconfigure(1, weight=1)
+        
+        r = 0
+        ttk.Label(input_grid, text=get_text("direction", self.current_language), font=self.fonts["button_bold"]).grid(row=r, column=0, sticky="w", pady=6, padx=(0, 10))  # Larger font and spacing
+        
+        # Radio buttons for Long/Short - larger
+        direction_frame = ttk.Frame(input_grid, style="Card.TFrame")
+        direction_frame.grid(row=r, column=1, sticky="ew", pady=6)  # Increased padding
+        
+        self.direction_var = tk.StringVar(value="Long")
+        self.rb_long = ttk.Radiobutton(direction_frame, text=get_text("long", self.current_language), variable=self.direction_var, value="Long", 
+                       style="TRadiobutton", command=self.update_direction_colors)
+        self.rb_long.pack(side="left", padx=(0, 25))  # Even more spacing
+        self.rb_short = ttk.Radiobutton(direction_frame, text=get_text("short", self.current_language), variable=self.direction_var, value="Short", 
+                        style="TRadiobutton", command=self.update_direction_colors)
+        self.rb_short.pack(side="left")
+        
+        # Initialize colors
+        self.update_direction_colors()
+
+        r += 1
+        ttk.Label(input_grid, text=get_text("entry_price", self.current_language), font=self.fonts["heading"]).grid(row=r, column=0, sticky="w", pady=6, padx=(0, 8))  # Even larger font and spacing
+        self.e_price = ttk.Entry(input_grid, width=20, font=self.fonts["input"])  # Larger font and width
+        self.e_price.grid(row=r, column=1, sticky="w", pady=6, padx=(0, 0))  
+        self.e_price.bind('<Return>', lambda e: self.calculate())
+        self._add_context_menu(self.e_price)
+
+        r += 1
+        ttk.Label(input_grid, text=get_text("max_loss", self.current_language), font=self.fonts["heading"]).grid(row=r, column=0, sticky="w", pady=6, padx=(0, 8))  # Even larger font and spacing
+        self.e_max_loss = ttk.Entry(input_grid, width=20, font=self.fonts["input"])  # Larger font and width
+        self.e_max_loss.grid(row=r, column=1, sticky="w", pady=6, padx=(0, 0))
+        self.e_max_loss.insert(0, "10.00")
+        self.e_max_loss.bind('<Return>', lambda e: self.calculate())
+        self._add_context_menu(self.e_max_loss)
+
+        r += 1
+        ttk.Label(input_grid, text=get_text("stop_loss_percent", self.current_language), font=self.fonts["heading"]).grid(row=r, column=0, sticky="w", pady=6, padx=(0, 8))  # Even larger font and spacing
+        self.e_sl_percent = ttk.Entry(input_grid, width=20, font=self.fonts["input"])  # Larger font and width
+        self.e_sl_percent.grid(row=r, column=1, sticky="w", pady=6, padx=(0, 0))
+        self.e_sl_percent.insert(0, "0.51")
+        self.e_sl_percent.bind('<Return>', lambda e: self.calculate())
+        self._add_context_menu(self.e_sl_percent)
+
+        # Leverage Card - same size as Basic Settings
+        leverage_card = ttk.Frame(main, style="Card.TFrame", padding=10)  # Same as input_card
+        leverage_card.pack(fill="x", pady=(0, 6))  # Same as input_card
+        
+        # Title with green accent
+        title_frame = ttk.Frame(leverage_card, style="Card.TFrame")
+        title_frame.pack(fill="x", pady=(0, 8))
+        
+        ttk.Label(title_frame, text="Hebelwirkung anpassen", 
+                 font=self.fonts["section"], foreground=PRIMARY).pack(anchor="w")  # Same size as Basic Settings
+        
+        # Leverage value display - centered and large
+        self.leverage_var = tk.IntVar(value=self.settings.get("leverage", 1))
+        
+        value_frame = ttk.Frame(leverage_card, style="Card.TFrame")
+        value_frame.pack(fill="x", pady=(0, 8))
+        
+        # Large leverage display - another 15% smaller
+        self.leverage_label = ttk.Label(value_frame, text=f"{self.leverage_var.get()}X", 
+                                       font=self.fonts["large"], foreground=TEXT)  # 23 * 0.85 = 19.55 ≈ 20
+        self.leverage_label.pack()
+        
+        # Slider - wider and centered
+        slider_frame = ttk.Frame(leverage_card, style="Card.TFrame")
+        slider_frame.pack(fill="x", pady=(0, 10))
+        
+        self.scale = ttk.Scale(
+            slider_frame, from_=1, to=125,
+            orient="horizontal", length=320,  # Increased to match button width
+            style="Modern.Horizontal.TScale",
+            variable=self.leverage_var
+        )
+        self.scale.pack(anchor="center")
+        self.scale.configure(command=self._on_leverage_slide)
+        
+        # Scale markers with proper spacing - centered to match slider
+        markers_frame = ttk.Frame(leverage_card, style="Card.TFrame")
+        markers_frame.pack(fill="x", pady=(3, 15))
+        markers_frame.configure(height=20)
+        
+        # Create inner frame for centering markers
+        markers_inner = ttk.Frame(markers_frame, style="Card.TFrame")
+        markers_inner.pack(anchor="center")
+        markers_inner.configure(width=320, height=25)  # Match slider width and ensure height
+        
+        tick_values = [1, 25, 50, 75, 100, 125]
+        for i, v in enumerate(tick_values):
+            marker_label = ttk.Label(markers_inner, text=f"{v}X", 
+                                   font=self.fonts["body_bold"], foreground=TEXT_MUTED)  # Larger, bold font
+            marker_label.place(relx=i/5, rely=0.5, anchor="center")
+        
+        # Leverage buttons - rounded style
+        buttons_frame = ttk.Frame(leverage_card, style="Card.TFrame")
+        buttons_frame.pack(fill="x", pady=(8, 0))
+        
+        # Center buttons to prevent clipping
+        button_container = ttk.Frame(buttons_frame, style="Card.TFrame")
+        button_container.pack(anchor="center")  # Centered to fit in wider window
+        
+        tick_values = [1, 25, 50, 75, 100, 125]
+        for i, v in enumerate(tick_values):
+            btn = ttk.Button(button_container, text=f"{v}×", 
+                           command=lambda val=v: self.set_leverage(val),
+                           style="Rounded.TButton", width=6)
+            btn.grid(row=0, column=i, padx=2, pady=2)
+
+        ttk.Button(leverage_card, text=get_text("sweep", self.current_language), command=self.open_sweep_window,
+                   style="Rounded.TButton").pack(anchor="center", pady=(8, 0))
+
+        # Advanced Settings (Collapsible Cards)
+        self.create_advanced_sections(main)
+        # Calculate Button
+        calc_frame = ttk.Frame(main, style="TFrame")
+        calc_frame.pack(fill="x", pady=(12, 15))
+        
+        # Calculate button frame for left alignment
+        calc_btn_frame = ttk.Frame(main, style="TFrame")
+        calc_btn_frame.pack(fill="x", pady=8)
+        
+        calc_btn = ttk.Button(calc_btn_frame, text=get_text("calculate", self.current_language), command=self.calculate, style="Primary.TButton")
+        calc_btn.pack(fill="x", padx=8)  # Centered padding
+
+        # Results Card
+        self.results_card = ttk.Frame(main, style="Card.TFrame", padding=12)
+        self.results_card.pack(fill="x", pady=(0, 8))
+        
+        ttk.Label(self.results_card, text=get_text("results", self.current_language), style="Heading.TLabel").pack(anchor="w", pady=(0, 8))
+        
+        self.results_grid = ttk.Frame(self.results_card, style="Card.TFrame")
+        self.results_grid.pack(fill="x")
+        self.results_grid.columnconfigure(1, weight=1)
+
+        self._add_result_row(0, get_text("nominal", self.current_language), "nominal", SUCCESS)
+        self._add_result_row(1, get_text("margin", self.current_language), "margin", WARNING)
+        self._add_result_row(2, get_text("sl_price", self.current_language), "sl_price", DANGER)
+        # TP rows follow the ladder length (see _sync_tp_result_rows)
+        self._sync_tp_result_rows()
+        
+        # P&L Info
+        self.pnl_card = ttk.Frame(main, style="Card.TFrame", padding=16)
+        self.pnl_card.pack(fill="x", pady=(0, 12))
+        
+        ttk.Label(self.pnl_card, text="💹 Profit & Loss Analyse", style="Heading.TLabel").pack(anchor="w", pady=(0, 8))
+        
+        self.extra = ttk.Label(main, text="", font=self.fonts["body"], foreground="#9598a1", justify="left")
+        self.extra.pack(fill="x", pady=(12, 0))
+
+        self._bind_live_inputs()
+        self.startup_stats["ui_ms"] = (time.perf_counter() - started) * 1000.0
+        self._startup_started = started  # first_frame_ms is taken by _after_first_frame
+
+    def _report_startup(self):
+        """Time until the mapped window was drawn; printed with NVC_TIMING set."""
+        self.startup_stats["first_frame_ms"] = (time.perf_counter() - self._startup_started) * 1000.0
+        if TIMING_REPORT:
+            print(f"startup: widgets {self.startup_stats['ui_ms']:.1f} ms, first frame {self.startup_stats['first_frame_ms']:.1f} ms, "
+                  f"collapsed sections deferred until expanded", file=sys.stderr)
+
+    def _lazy_section(self, name: str, build):
+        """Collapsible builder that times the deferred construction and applies the current zoom."""
+        def run(body):
+            t = time.perf_counter()
+            build(body)
+            if self.fonts.zoom != 1.0:
+                self.apply_zoom(self.fonts.zoom)  # new widgets were built at base size
+            ms = self.startup_stats["deferred"][name] = (time.perf_counter() - t) * 1000.0
+            if TIMING_REPORT:
+                print(f"section {name}: built on first expand in {ms:.1f} ms (saved at startup)", file=sys.stderr)
+        return run
+        
+    def update_direction_colors(self):
+        """Update radio button colors based on selection using ttk styles"""
+        selected = self.direction_var.get()
+        style = ttk.Style()
+        
+        if selected == "Long":
+            # Long selected - green for Long, muted for Short - even larger font
+            style.configure("Long.TRadiobutton", foreground="#4CAF50", font=self.fonts["direction"])  # Green, even larger font
+            style.configure("Short.TRadiobutton", foreground="#9598a1", font=self.fonts["direction"])  # Muted gray, even larger font
+            self.rb_long.configure(style="Long.TRadiobutton")
+            self.rb_short.configure(style="Short.TRadiobutton")
+        else:
+            # Short selected - red for Short, muted for Long - even larger font
+            style.configure("Long.TRadiobutton", foreground="#9598a1", font=self.fonts["direction"])  # Muted gray, even larger font
+            style.configure("Short.TRadiobutton", foreground="#F44336", font=self.fonts["direction"])  # Red, even larger font
+            self.rb_long.configure(style="Long.TRadiobutton")
+            self.rb_short.configure(style="Short.TRadiobutton")
+        
+    def create_advanced_sections(self, parent):
+        # Section inputs live in Tk variables, so they exist before their widgets are built on first expand
+        lang = self.current_language
+        self.entry_side_var = tk.StringVar(self, "Taker")
+        self.exit_side_var = tk.StringVar(self, "Taker")
+        self.fee_tier_var = tk.StringVar(self, self.settings.get("fee_tier") or get_text("fee_manual", lang))
+        self.fee_discount_var = tk.BooleanVar(self, bool(self.settings.get("fee_discount", False)))
+        self.maker_var = tk.StringVar(self, f"{self.settings.get('maker_fee', 0.03)}")
+        self.taker_var = tk.StringVar(self, f"{self.settings.get('taker_fee', 0.07)}")
+        self.format_var = tk.StringVar(self, NUMBER_LOCALES.get(self.settings.get("number_format", "german"), NUMBER_LOCALES["german"]).label)
+        self.language_var = tk.StringVar(self, self.texts["_name"])
+        self.bracket_table_var = tk.StringVar(self, self.settings.get("bracket_table", DEFAULT_BRACKET_TABLE))
+        self.tp_mode_var = tk.StringVar(self, "R-Multiple")
+        # Start with the classic 1R/2R/3R (1%/2%/3%) ladder
+        for r, p in zip(DEFAULT_TP_R, DEFAULT_TP_PERCENT):
+            self.add_tp_level(f"{r:g}", f"{p:.2f}", recalc=False)
+
+        # Collapsible Fees Section
+        Collapsible(parent, "💸 Handelsgebühren", initially_open=False,
+                    build=self._lazy_section("fees", self._build_fees_section)).pack(fill="x", pady=(0, 12))
+        # Collapsible Settings Section
+        Collapsible(parent, "⚙️ Gebühren-Einstellungen", initially_open=False,
+                    build=self._lazy_section("settings", self._build_settings_section)).pack(fill="x", pady=(0, 12))
+        # Collapsible Take-Profit Section
+        Collapsible(parent, "🎯 Take-Profit Konfiguration", initially_open=False,
+                    build=self._lazy_section("tp", self._build_tp_section)).pack(fill="x", pady=(0, 12))
+
+    def _build_fees_section(self, body):
+        fees_grid = ttk.Frame(body, style="Card.TFrame", padding=10)  # Reduced from 16 to 10
+        fees_grid.pack(fill="x")
+        fees_grid.columnconfigure(1, weight=1)
+        fees_grid.columnconfigure(3, weight=1)
+        
+        ttk.Label(fees_grid, text="Entry:", font=self.fonts["label"]).grid(row=0, column=0, sticky="w", pady=6, padx=(0, 6))  # Scaled down
+        self.cb_entry_side = ttk.Combobox(fees_grid, values=["Taker", "Maker"], state="readonly", width=10, font=self.fonts["entry"], textvariable=self.entry_side_var)  # Scaled down
+        self.cb_entry_side.grid(row=0, column=1, sticky="ew", pady=6, padx=(0, 12))
+        
+        ttk.Label(fees_grid, text="Exit:", font=self.fonts["label"]).grid(row=0, column=2, sticky="w", pady=6, padx=(0, 6))  # Scaled down
+        self.cb_exit_side = ttk.Combobox(fees_grid, values=["Taker", "Maker"], state="readonly", width=10, font=self.fonts["entry"], textvariable=self.exit_side_var)  # Scaled down
+        self.cb_exit_side.grid(row=0, column=3, sticky="ew", pady=6)
+
+        # Exchange fee tier (fee_schedule.json) instead of the manual maker/taker values
+        ttk.Label(fees_grid, text=get_text("fee_tier", self.current_language), font=self.fonts["label"]).grid(row=1, column=0, sticky="w", pady=6, padx=(0, 6))
+        try:
+            tiers = load_fee_schedule().names()
+        except (OSError, ValueError, KeyError):
+            tiers = []
+        manual = get_text("fee_manual", self.current_language)
+        if self.fee_tier_var.get() not in tiers:
+            self.fee_tier_var.set(manual)
+        self.cb_fee_tier = ttk.Combobox(fees_grid, values=[manual] + tiers, state="readonly", width=16, font=self.fonts["entry"], textvariable=self.fee_tier_var)
+        self.cb_fee_tier.grid(row=1, column=1, sticky="ew", pady=6, padx=(0, 12))
+        self.cb_fee_tier.bind("<<ComboboxSelected>>", self._on_fee_tier_change)
+        ttk.Checkbutton(fees_grid, text=get_text("fee_discount", self.current_language), variable=self.fee_discount_var,
+                        command=self._on_fee_tier_change).grid(row=1, column=2, columnspan=2, sticky="w", pady=6)
+
+    def _build_settings_section(self, body):
+        settings_content = ttk.Frame(body, style="Card.TFrame", padding=10)  # Reduced from 16 to 10
+        settings_content.pack(fill="x")
+        
+        settings_grid = ttk.Frame(settings_content, style="Card.TFrame")
+        settings_grid.pack(fill="x")
+        settings_grid.columnconfigure(1, weight=1)
+        settings_grid.columnconfigure(3, weight=1)
+        
+        ttk.Label(settings_grid, text="Maker (%):", font=self.fonts["label"]).grid(row=0, column=0, sticky="w", pady=6, padx=(0, 6))  # Scaled down
+        self.e_maker = ttk.Entry(settings_grid, width=10, font=self.fonts["entry"], textvariable=self.maker_var)  # Scaled down
+        self.e_maker.grid(row=0, column=1, sticky="ew", pady=6, padx=(0, 12))
+        self.e_maker.bind('<Return>', lambda e: self.calculate())
+        self._add_context_menu(self.e_maker)
+        
+        ttk.Label(settings_grid, text="Taker (%):", font=self.fonts["label"]).grid(row=0, column=2, sticky="w", pady=6, padx=(0, 6))  # Scaled down
+        self.e_taker = ttk.Entry(settings_grid, width=10, font=self.fonts["entry"], textvariable=self.taker_var)  # Scaled down
+        self.e_taker.grid(row=0, column=3, sticky="ew", pady=6)
+        self.e_taker.bind('<Return>', lambda e: self.calculate())
+        self._add_context_menu(self.e_taker)
+        
+        # Add number format settings
+        ttk.Label(settings_grid, text=get_text("number_format", self.current_language), font=self.fonts["label"]).grid(row=1, column=0, sticky="w", pady=6, padx=(0, 6))  # Scaled down
+        self.cb_format = ttk.Combobox(settings_grid, values=[loc.label for loc in NUMBER_LOCALES.values()], state="readonly", width=16, font=self.fonts["entry"], textvariable=self.format_var)  # Scaled down
+        self.cb_format.grid(row=1, column=1, sticky="ew", pady=6, padx=(0, 12))
+        self.cb_format.bind("<<ComboboxSelected>>", self._on_format_change)
+        
+        # Add language settings
+        ttk.Label(settings_grid, text=get_text("language", self.current_language), font=self.fonts["label"]).grid(row=1, column=2, sticky="w", pady=6, padx=(0, 6))  # Scaled down
+        self._languages = available_languages()  # language -> name, read when the section is built
+        self.cb_language = ttk.Combobox(settings_grid, values=list(self._languages.values()), state="readonly", width=12, font=self.fonts["entry"], textvariable=self.language_var)  # Scaled down
+        self.cb_language.grid(row=1, column=3, sticky="ew", pady=6)
+        self.cb_language.bind("<<ComboboxSelected>>", self._on_language_change)
+
+        # Maintenance-margin brackets for the liquidation price
+        ttk.Label(settings_grid, text=get_text("liq_table", self.current_language), font=self.fonts["label"]).grid(row=2, column=0, sticky="w", pady=6, padx=(0, 6))
+        try:
+            tables = sorted(load_brackets())
+        except (OSError, ValueError):
+            tables = []
+        self.cb_bracket_table = ttk.Combobox(settings_grid, values=tables, state="readonly", width=16, font=self.fonts["entry"], textvariable=self.bracket_table_var)
+        self.cb_bracket_table.grid(row=2, column=1, sticky="ew", pady=6, padx=(0, 12))
+        self.cb_bracket_table.bind("<<ComboboxSelected>>", self._on_bracket_table_change)
+        
+        ttk.Button(settings_content, text=get_text("save", self.current_language), command=self.on_save_settings, style="Modern.TButton")\
+            .pack(pady=(8, 0))  # Reduced padding
+
+    def _build_tp_section(self, body):
+        tp_content = ttk.Frame(body, style="Card.TFrame", padding=10)  # Reduced from 16 to 10
+        tp_content.pack(fill="x")
+        
+        tp_mode_frame = ttk.Frame(tp_content, style="Card.TFrame")
+        tp_mode_frame.pack(fill="x", pady=(0, 8))  # Reduced padding
+        
+        ttk.Label(tp_mode_frame, text="Modus:", font=self.fonts["label"]).pack(side="left", padx=(0, 6))  # Scaled down
+        self.cb_tp_mode = ttk.Combobox(tp_mode_frame, values=["R-Multiple", "Prozent"], state="readonly", width=12, font=self.fonts["entry"], textvariable=self.tp_mode_var)  # Scaled down
+        self.cb_tp_mode.pack(side="left")
+        
+        ttk.Button(tp_mode_frame, text="−", width=3, command=self.remove_tp_level).pack(side="right")
+        ttk.Button(tp_mode_frame, text="+", width=3, command=self.add_tp_level).pack(side="right", padx=(0, 4))
+
+        self.tp_grid = ttk.Frame(tp_content, style="Card.TFrame")
+        self.tp_grid.pack(fill="x")
+        for col in (1, 2, 3):
+            self.tp_grid.columnconfigure(col, weight=1)
+        for col, text in ((1, "R"), (2, "%"), (3, get_text("tp_close", self.current_language))):
+            ttk.Label(self.tp_grid, text=text, font=self.fonts["entry_bold"]).grid(row=0, column=col, sticky="w", padx=(0, 6))
+
+        for i in range(1, len(self.tp_rows) + 1):
+            self._build_tp_row(i)
+        self.update_tp_visibility()
+
+    def on_window_resize(self, event):
+        """Handle window resize with CSS-like zoom scaling"""
+        if event.widget == self:
+            # Immediate resize for better responsiveness
+            if hasattr(self, '_resize_after_id'):
+                self.after_cancel(self._resize_after_id)
+            self._resize_after_id = self.after(10, self._do_css_zoom)
+    
+    def _do_css_zoom(self):
+        """Apply CSS-like zoom to entire content"""
+        window_width = self.winfo_width()
+        
+        # Calculate zoom factor based on window width
+        base_width = 520
+        
+        # Zoom system: keep original size for wide windows, scale down for narrow windows
+        if window_width >= base_width:
+            # For wide windows: keep original size (1.0x zoom)
+            zoom_factor = 1.0
+        else:
+            # For narrow windows: scale down to fit content
+            zoom_factor = window_width / base_width
+        
+        zoom_factor = max(0.1, min(1.0, zoom_factor))  # Allow more aggressive scaling
+        self.apply_zoom(zoom_factor, canvas_width=window_width - 20)
+    
+    def _zoom_targets(self):
+        """(widget, option) pairs whose size follows the zoom - fonts are handled by self.fonts."""
+        names = ("e_price", "e_max_loss", "e_sl_percent", "e_maker", "e_taker", "cb_entry_side", "cb_exit_side",
+                 "cb_fee_tier", "cb_format", "cb_language", "cb_bracket_table", "cb_tp_mode")
+        for name in names:
+            if hasattr(self, name):
+                yield getattr(self, name), "width"
+        for _lbl, *entries in self.tp_widgets:
+            for entry in entries:
+                yield entry, "width"
+        for name in ("main_frame", "results_card", "pnl_card"):
+            if hasattr(self, name):
+                yield getattr(self, name), "padding"
+    
+    def apply_zoom(self, zoom, canvas_width=None):
+        """
+        Zoom the whole UI in one layout transaction: fonts by role, then every
+        size option collected and applied with one configure per widget and a
+        single idle flush. Sizes are scaled from the values the widgets were
+        built with, so zooms never compound. Cost is kept in self.zoom_stats.
+        """
+        started = time.perf_counter()
+        tk_calls = self.fonts.set_zoom(zoom)
+        tx = ScaleTransaction()
+        for widget, option in self._zoom_targets():
+            key = (widget, option)
+            if key not in self._zoom_base:
+                # Never scaled before - the current value is the built-in base
+                self._zoom_base[key] = widget.cget(option)
+                tk_calls += 1
+            scaled = scale_option(self._zoom_base[key], zoom)
+            if scaled is not None:
+                tx.configure(widget, **{option: scaled})
+        if canvas_width is not None and hasattr(self, "main_canvas"):
+            tx.configure(self.main_canvas, width=canvas_width)
+        tk_calls += tx.commit(self)
+        self.zoom_stats = {"zoom": zoom, "tk_calls": tk_calls, "ms": (time.perf_counter() - started) * 1000.0}
+        if TIMING_REPORT:
+            print(f"zoom {zoom:.2f}: {tk_calls} Tk calls, {self.zoom_stats['ms']:.1f} ms", file=sys.stderr)
+
+    def create_scroll_indicator(self, canvas):
+        """Create a subtle scroll indicator to show scrollable content"""
+        # Create scroll hint at bottom right
+        self.scroll_hint = tk.Label(self, text="⇅ Scroll", 
+                                   font=self.fonts["small"], 
+                                   fg="#666666", bg="#121212",
+                                   relief="flat")
+        self.scroll_hint.place(relx=0.98, rely=0.98, anchor="se")
+        
+        # Auto-hide after 3 seconds
+        self.after(3000, lambda: self.scroll_hint.place_forget())
+        
+        # Show hint again when scrolling reaches top or bottom
+        def check_scroll_position():
+            try:
+                top, bottom = canvas.yview()
+                if bottom >= 1.0:  # At bottom
+                    self.scroll_hint.config(text="⇈ Scroll Up")
+                    self.scroll_hint.place(relx=0.98, rely=0.98, anchor="se")
+                    self.after(2000, lambda: self.scroll_hint.place_forget())
+                elif top <= 0.0:  # At top
+                    self.scroll_hint.config(text="⇊ Scroll Down")
+                    self.scroll_hint.place(relx=0.98, rely=0.98, anchor="se")
+                    self.after(2000, lambda: self.scroll_hint.place_forget())
+            except:
+                pass
+        
+        # Bind scroll position check to canvas
+        def on_scroll_check(event):
+            self.after(100, check_scroll_position)
+        
+        canvas.bind("<Configure>", on_scroll_check)
+
+    # ---------- UI helpers ----------
+    def _on_leverage_slide(self, value):
+        """Robuster Slider-Callback mit 1er Schritten."""
+        try:
+            leverage = int(float(value) + 0.5)  # Runden auf ganze Zahl
+        except Exception:
+            leverage = self.leverage_var.get()
+        leverage = max(1, min(leverage, 125))
+        self.leverage_var.set(leverage)
+        self.leverage_label.config(text=f"{leverage}X")
+        self._preview_margin(leverage)
+        self._schedule_recalc("leverage")
+        # In memory only - the settings store writes once the drag pauses
+        self.settings["leverage"] = leverage
+
+    def set_leverage(self, value):
+        """Set leverage to specific value via button click."""
+        self.leverage_var.set(value)
+        self.scale.set(value)
+        self.leverage_label.config(text=f"{value}X")
+        self._preview_margin(value)
+        self._schedule_recalc("leverage")
+
+    def _preview_margin(self, leverage):
+        """Update the margin label from the cached sweep grid - a lookup, no recalculation."""
+        if self._margin_preview is None:
+            return
+        grid, sl_percent, number_format = self._margin_preview
+        try:
+            _, margin, _ = grid.lookup(sl_percent, int(leverage))
+        except KeyError:
+            return
+        self._set_result("margin", fmt_money(margin, number_format))
+
+    def open_sweep_window(self):
+        """Scrollable leverage × SL% table for the current entry, max loss and fees, with CSV export."""
+        lang = self.current_language
+        win = tk.Toplevel(self)
+        win.title(get_text("sweep_title", lang))
+        win.configure(bg="#121212")
+        win.geometry("520x560")
+
+        style = ttk.Style(win)
+        style.configure("Sweep.Treeview", background="#1E1E1E", fieldbackground="#1E1E1E", foreground="#EAEAEA",
+                        font=self.fonts["body"], rowheight=20)
+        style.configure("Sweep.Treeview.Heading", background="#2A2A2A", foreground="#e2ff00", font=self.fonts["body_bold"])
+
+        controls = ttk.Frame(win, padding=8)
+        controls.pack(fill="x")
+        range_entries = []
+        for col, (key, default) in enumerate((("sl_from", "0.1"), ("sl_to", "2.0"), ("sl_step", "0.1"))):
+            ttk.Label(controls, text=get_text(key, lang)).grid(row=0, column=2*col, sticky="w", padx=(0, 4))
+            e = ttk.Entry(controls, width=7)
+            e.grid(row=0, column=2*col+1, sticky="w", padx=(0, 10))
+            e.insert(0, default)
+            e.bind('<Return>', lambda _e: fill())
+            self._add_context_menu(e)
+            range_entries.append(e)
+
+        table_frame = ttk.Frame(win, padding=(8, 0))
+        table_frame.pack(fill="both", expand=True)
+        columns = ("sl", "leverage", "nominal", "margin", "net_sl")
+        headings = ("SL %", get_text("leverage", lang), get_text("nominal", lang), get_text("margin", lang), get_text("net_sl", lang))
+        tree = ttk.Treeview(table_frame, columns=columns, show="headings", style="Sweep.Treeview")
+        for col, heading in zip(columns, headings):
+            tree.heading(col, text=heading)
+            tree.column(col, width=90, anchor="e")
+        vsb = ttk.Scrollbar(table_frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=vsb.set)
+        tree.pack(side="left", fill="both", expand=True)
+        vsb.pack(side="right", fill="y")
+
+        state = {"grid": None, "number_format": "german"}
+
+        def fill():
+            try:
+                number_format = self._number_format()
+                start, stop, step = (parse_num(e.get(), number_format) for e in range_entries)
+                grid = leverage_sweep(self.direction_var.get(), parse_num(self.e_price.get(), number_format),
+                                      parse_num(self.e_max_loss.get(), number_format),
+                                      self.fee_for(self.entry_side_var.get()), self.fee_for(self.exit_side_var.get()),
+                                      sl_range(start, stop, step))
+            except Exception as e:
+                messagebox.showerror(get_text("error", lang), f"{get_text('invalid_input', lang)}\n{e}", parent=win)
+                return
+            tree.delete(*tree.get_children())
+            for sl, lev, nominal, margin, net in grid.rows():
+                tree.insert("", "end", values=(fmt_num(sl, 2, number_format), f"{lev}×", fmt_money(nominal, number_format),
+                                               fmt_money(margin, number_format), fmt_money(net, number_format)))
+            state["grid"], state["number_format"] = grid, number_format
+
+        def export():
+            grid, number_format = state["grid"], state["number_format"]
+            if grid is None:
+                return
+            path = filedialog.asksaveasfilename(parent=win, defaultextension=".csv", filetypes=[("CSV", "*.csv")])
+            if not path:
+                return
+            try:
+                with open(path, "w", newline="", encoding="utf-8") as f:
+                    writer = csv.writer(f, delimiter=csv_delimiter(number_format))
+                    writer.writerow(["sl_percent", "leverage", "nominal", "margin", "net_sl_loss"])
+                    sl, lev, nominal, margin, net = zip(*grid.rows())
+                    writer.writerows(zip(format_column(sl, 6, number_format), lev, format_column(nominal, 2, number_format),
+                                         format_column(margin, 2, number_format), format_column(net, 2, number_format)))
+            except OSError as e:
+                messagebox.showerror(get_text("error", lang), str(e), parent=win)
+
+        buttons = ttk.Frame(win, padding=8)
+        buttons.pack(fill="x")
+        ttk.Button(buttons, text=get_text("calculate", lang), command=fill, style="Rounded.TButton").pack(side="left")
+        ttk.Button(buttons, text=get_text("export", lang), command=export, style="Rounded.TButton").pack(side="right")
+        fill()
+
+    def _number_format(self) -> str:
+        """Key of NUMBER_LOCALES for the format chosen in the settings."""
+        label = self.format_var.get()
+        return next((name for name, loc in NUMBER_LOCALES.items() if loc.label == label), "german")
+
+    def _current_leverage(self):
+        """Get current leverage value."""
+        return self.leverage_var.get()
+    
+    def fee_for(self, side):
+        """Get fee percentage for given side (Maker/Taker) - from the fee tier if one is selected."""
+        tier = self.settings.get("fee_tier")
+        if tier:
+            try:
+                return load_fee_schedule().fee(tier, side, self.settings.get("fee_discount", False))
+            except (OSError, ValueError, KeyError):
+                pass  # schedule missing or tier removed - fall back to the manual fees
+        if side == "Maker":
+            return self.settings.get("maker_fee", 0.014)
+        else:  # Taker
+            return self.settings.get("taker_fee", 0.042)
+    
+    def _add_context_menu(self, entry_widget):
+        """Add right-click context menu to entry widgets."""
+        def show_context_menu(event):
+            try:
+                context_menu = tk.Menu(self, tearoff=0)
+                context_menu.add_command(label="Ausschneiden", command=lambda: self._cut_text(entry_widget))
+                context_menu.add_command(label="Kopieren", command=lambda: self._copy_text(entry_widget))
+                context_menu.add_command(label="Einfügen", command=lambda: self._paste_text(entry_widget))
+                context_menu.add_separator()
+                context_menu.add_command(label="Alles auswählen", command=lambda: self._select_all(entry_widget))
+                context_menu.tk_popup(event.x_root, event.y_root)
+            except Exception:
+                pass
+            finally:
+                try:
+                    context_menu.destroy()
+                except:
+                    pass
+        
+        entry_widget.bind("<Button-3>", show_context_menu)  # Right-click
+    
+    def _cut_text(self, entry_widget):
+        """Cut text from entry widget."""
+        try:
+            if entry_widget.selection_present():
+                entry_widget.event_generate("<<Cut>>")
+        except:
+            pass
+    
+    def _copy_text(self, entry_widget):
+        """Copy text from entry widget."""
+        try:
+            if entry_widget.selection_present():
+                entry_widget.event_generate("<<Copy>>")
+        except:
+            pass
+    
+    def _paste_text(self, entry_widget):
+        """Paste text to entry widget."""
+        try:
+            entry_widget.event_generate("<<Paste>>")
+        except:
+            pass
+    
+    def _select_all(self, entry_widget):
+        """Select all text in entry widget."""
+        try:
+            entry_widget.select_range(0, tk.END)
+        except:
+            pass
+
+    def update_tp_visibility(self):
+        mode = self.tp_mode_var.get()
+        for _lbl, e_r, e_p, _e_close in self.tp_widgets:
+            e_r.configure(state=("normal" if mode == "R-Multiple" else "disabled"))
+            e_p.configure(state=("normal" if mode == "Prozent" else "disabled"))
+
+    # ---------- Take-profit ladder ----------
+    def add_tp_level(self, r_value: str = "", p_value: str = "", close: str = "", recalc: bool = True):
+        """Append a TP level (R, %, close-%) to the ladder; its entries exist once the TP section is built."""
+        if len(self.tp_rows) >= MAX_TP_LEVELS:
+            return
+        i = len(self.tp_rows) + 1
+        row = tuple(tk.StringVar(self, value) for value in (r_value, p_value, close))
+        for col, var in enumerate(row):
+            var.trace_add("write", lambda *_a, n=(f"tp{i}_value" if col < 2 else "tp_close"): self._schedule_recalc(n))
+        self.tp_rows.append(row)
+        if hasattr(self, "tp_grid"):
+            self._build_tp_row(i)
+        if recalc:
+            self._on_tp_levels_changed()
+
+    def _build_tp_row(self, i: int):
+        """Label and entries of TP level i in the TP grid."""
+        lbl = ttk.Label(self.tp_grid, text=f"TP{i}:", font=self.fonts["entry_bold"])
+        lbl.grid(row=i, column=0, sticky="w", pady=3, padx=(0, 3))
+        entries = []
+        for col, var in enumerate(self.tp_rows[i-1], start=1):
+            e = ttk.Entry(self.tp_grid, width=6, font=self.fonts["entry"], textvariable=var)
+            e.grid(row=i, column=col, sticky="ew", pady=3, padx=(0, 6))
+            e.bind('<Return>', lambda _e: self.calculate())
+            self._add_context_menu(e)
+            entries.append(e)
+        self.tp_widgets.append((lbl, *entries))
+
+    def remove_tp_level(self):
+        """Drop the last TP level (at least one stays)."""
+        if len(self.tp_rows) <= 1:
+            return
+        self.tp_rows.pop()
+        if len(self.tp_widgets) > len(self.tp_rows):
+            for w in self.tp_widgets.pop():
+                w.destroy()
+        self._on_tp_levels_changed()
+
+    def _on_first_map(self, event):
+        """
+        First frame hook: an idle callback from __init__ could run before the window is
+        drawn - too early both for the startup timing and for the logo (PIL on a cold cache).
+        """
+        # The root's bindings also see <Map> of every child; only the window itself counts
+        if event.widget is not self or self._first_map_seen:
+            return
+        self._first_map_seen = True  # flag, not unbind: unbind(seq, id) drops every <Map> binding before 3.13
+        self.after_idle(self.after, 1, self._after_first_frame)  # idle first: lets Tk finish drawing the mapped window
+
+    def _after_first_frame(self):
+        self._report_startup()  # before the logo, which is not part of the first frame
+        self._load_logo()
+
+    def _load_logo(self):
+        """Show the cached, pre-scaled logo; colorful text if there is none."""
+        try:
+            path = cached_logo()
+            if path is None:
+                raise FileNotFoundError("No image found")
+            self.wundaguad_photo = tk.PhotoImage(file=path)
+            ttk.Label(self.logo_slot, image=self.wundaguad_photo).pack(side="left", padx=(2, 2))
+            return
+        except Exception as e:
+            # Fallback to colorful text if image not found
+            print(f"WUNDAGUAD image not found: {e}")  # Debug info
+        for letter, color in (("W", "#FF0000"), ("U", "#FF6600"), ("N", "#e2ff00"), ("D", "#66FF00"), ("A", "#00FFCC"),
+                              ("G", "#0099FF"), ("U", "#6666FF"), ("A", "#CC66FF"), ("D", "#FF99CC")):
+            ttk.Label(self.logo_slot, text=letter, font=self.fonts["label"], foreground=color).pack(side="left")
+
+    def _on_tp_levels_changed(self):
+        """The ladder length changed: new result rows and a full recalculation."""
+        self.update_tp_visibility()
+        self._sync_tp_result_rows()
+        self._live = None
+        self._schedule_recalc()
+
+    def _add_result_row(self, row: int, title: str, key: str, color: str) -> ResultRow:
+        """Build one result row (title, value, copy button) and register it under key."""
+        title_lbl = ttk.Label(self.results_grid, text=f"{title} :", font=self.fonts["body_bold"])
+        title_lbl.grid(row=row, column=0, sticky="w", pady=5, padx=(0, 15))  # Smaller font
+        
+        result_frame = ttk.Frame(self.results_grid, style="Surface.TFrame")
+        result_frame.grid(row=row, column=1, sticky="ew", pady=5)  # More vertical spacing
+        result_frame.columnconfigure(0, weight=1)
+        
+        lbl = ttk.Label(result_frame, text="0.00", font=self.fonts["heading"], foreground=color)  # Larger font
+        lbl.pack(side="left", padx=8, pady=4)  # Centered padding
+        
+        # Use copy button style matching result color
+        if "nominal" in key or "margin" in key:
+            button_style = "Success.Copy.TButton" if "nominal" in key else "Warning.Copy.TButton"
+        elif "sl" in key:
+            button_style = "Danger.Copy.TButton"
+        else:  # TP buttons
+            button_style = "Profit.Copy.TButton"
+        
+        copy_btn = ttk.Button(result_frame, text="📋", style=button_style,
+                              command=lambda: self.copy_with_feedback(key))
+        copy_btn.pack(side="right", padx=(10, 0))  # More spacing
+        
+        self.result_rows[key] = ResultRow(key, title_lbl, result_frame, lbl, copy_btn)
+        return self.result_rows[key]
+
+    def _tp_result_count(self) -> int:
+        return len(self.result_rows) - 3  # nominal, margin, sl_price come first
+
+    def _sync_tp_result_rows(self):
+        """Add or remove TP result rows until there is one per ladder level."""
+        while self._tp_result_count() < len(self.tp_rows):
+            i = self._tp_result_count() + 1
+            self._add_result_row(2 + i, tp_title(i, self.current_language), f"tp{i}", self.tp_result_color)
+        while self._tp_result_count() > len(self.tp_rows):
+            key = f"tp{self._tp_result_count()}"
+            row = self.result_rows.pop(key)
+            if key in self._copy_reset_ids:  # the button goes away before its 📋 comes back
+                self.after_cancel(self._copy_reset_ids.pop(key))
+            row.title.destroy()
+            row.frame.destroy()
+            self._last_values.pop(key, None)
+
+    def copy_to_clipboard(self, text: str):
+        """Copy text to clipboard"""
+        if not text:
+            return
+        try:
+            self.clipboard_clear()
+            self.clipboard_append(text)
+            self.update()
+        except Exception:
+            pass
+    
+    def copy_with_feedback(self, key: str):
+        """Copy a result value to clipboard with visual feedback on its own copy button"""
+        row = self.result_rows.get(key)
+        if row is None:
+            return
+        text = row.label.cget("text")
+        if not text:
+            return
+        
+        # Copy to clipboard
+        self.copy_to_clipboard(text)
+        
+        # Change to checkmark, reset after 1 second
+        row.button.configure(text='🟢✅')
+        if key in self._copy_reset_ids:  # copied again: the second copy gets its full second
+            self.after_cancel(self._copy_reset_ids[key])
+        self._copy_reset_ids[key] = self.after(1000, self._reset_copy_button, key)
+
+    def _reset_copy_button(self, key: str):
+        self._copy_reset_ids.pop(key, None)
+        row = self.result_rows.get(key)
+        if row is not None:
+            row.button.configure(text='📋')
+
+    def reset_inputs(self):
+        """Reset all input fields to default values"""
+        try:
+            # Reset basic inputs
+            self.e_price.delete(0, tk.END)
+            self.e_max_loss.delete(0, tk.END)
+            self.e_max_loss.insert(0, "10.00")
+            self.e_sl_percent.delete(0, tk.END)
+            self.e_sl_percent.insert(0, "0")
+            
+            # Reset direction to Long
+            self.direction_var.set("Long")
+            self.update_direction_colors()
+            
+            # Reset leverage to 1
+            self.leverage_var.set(1)
+            self.leverage_label.config(text="1X")
+            self.scale.set(1)
+            
+            # Clear results
+            for row in self.result_rows.values():
+                row.label.config(text="0.00")
+            self._last_values.clear()
+                
+            # Clear extra info
+            if hasattr(self, 'extra'):
+                self.extra.config(text="")
+            self._extra_lines = []
+            self._last_result = self._live = self._margin_preview = None
+                
+        except Exception as e:
+            print(f"Reset error: {e}")
+
+    def copy_value(self, key: str):
+        val = self._last_values.get(key, "")
+        if not val:
+            return
+        try:
+            self.clipboard_clear()
+            self.clipboard_append(val)
+            self.update()
+        except Exception:
+            pass
+
+    def calculate(self, quiet: bool = False):
+        try:
+            direction   = self.direction_var.get().lower()
+            number_format = self._number_format()
+            entry_price = parse_num(self.e_price.get(), number_format)
+            max_loss    = parse_num(self.e_max_loss.get(), number_format)
+            sl_percent  = parse_num(self.e_sl_percent.get(), number_format)
+            leverage    = self._current_leverage()
+
+            entry_fee = self.fee_for(self.entry_side_var.get())
+            exit_fee  = self.fee_for(self.exit_side_var.get())
+
+            # TP ladder - only the fields of the active mode are parsed
+            mode = self.tp_mode_var.get()
+            col = 0 if mode == "R-Multiple" else 1
+            levels = [TPLevel(parse_num(row[col].get(), number_format), parse_num(row[2].get(), number_format) / 100.0, mode)
+                      for row in self.tp_rows]
+            tp_values = [lv.value for lv in levels]
+
+            # Nominal so that (nominal * sl_percent/100) = max_loss, independent of leverage
+            res, ladder = calculate_ladder(direction, entry_price, max_loss, sl_percent, levels, leverage,
+                                           entry_fee, exit_fee)
+            # Cached leverage grid for this setup: slider moves only look up the margin
+            self._margin_preview = (leverage_sweep(direction, entry_price, max_loss, entry_fee, exit_fee, (sl_percent,)),
+                                    sl_percent, number_format)
+            self._last_result = res
+            self._tp_fractions = ladder.fractions
+            self._live = IncrementalPosition(res, mode, tp_values)
+            self._render_result(res, number_format)
+
+        except Exception as e:
+            if quiet:
+                return
+            messagebox.showerror(get_text("error", self.current_language), f"{get_text('invalid_input', self.current_language)}\n{e}")
+
+    def _render_result(self, res, number_format: str):
+        """Fill the result labels and P&L text from raw numbers - no parsing, no math."""
+
+        # Big outputs
+        self._set_result("nominal", fmt_money(res.nominal, number_format))
+        self._set_result("margin", fmt_money(res.margin, number_format))
+        self._set_result("sl_price", fmt_num(res.sl_price, 6, number_format))
+        for i, price in enumerate(res.tp_prices, start=1):
+            self._set_result(f"tp{i}", fmt_num(price, 6, number_format))
+
+        self._extra_lines = [self._fees_line(res, number_format), self._risk_line(res, number_format),
+                             self._liq_line(res, number_format), "", self._sl_line(res, number_format)]
+        self._extra_lines += [self._tp_line(res, i, number_format) for i in range(1, len(res.tp_prices) + 1)]
+        self._extra_lines.append(self._blended_line(res, number_format))
+        self._render_extra()
+
+    def _fees_line(self, res, number_format: str) -> str:
+        return (f"{self.texts.templates['fees_info'](entry_fee=fmt_num(res.entry_fee,3,number_format), exit_fee=fmt_num(res.exit_fee,3,number_format), total_fee=fmt_num(res.total_fee_pct,3,number_format))} "
+                f"(≈ {fmt_money(res.entry_fee_amt,number_format)} + {fmt_money(res.exit_fee_amt,number_format)} = {fmt_money(res.total_fees_amt,number_format)})")
+
+    def _risk_line(self, res, number_format: str) -> str:
+        return self.texts.templates['effective_risk'](risk=fmt_num(res.effective_risk_pct,3,number_format), leverage=int(res.leverage))
+
+    def _liq_line(self, res, number_format: str):
+        """Liquidation price for the selected bracket table, with SL/leverage warnings. None without table."""
+        try:
+            liq = liquidation_for(res, bracket_table(self.settings.get("bracket_table", DEFAULT_BRACKET_TABLE)))
+        except (OSError, ValueError, ZeroDivisionError):
+            return None
+        t = self.texts
+        line = t.templates["liquidation"](price=fmt_num(liq.liq_price, 6, number_format), mmr=fmt_num(liq.mmr, 2, number_format))
+        if liq.sl_beyond_liq:
+            line += "\n" + t["liq_warning"]
+        if not liq.leverage_ok:
+            line += "\n" + t.templates["leverage_warning"](max=int(liq.max_leverage))
+        return line
+
+    def _sl_line(self, res, number_format: str) -> str:
+        return self.texts.templates['sl_pnl'](gross=fmt_money(res.sl_gross,number_format), net=fmt_money(res.sl_net,number_format))
+
+    def _tp_line(self, res, i: int, number_format: str) -> str:
+        return self.texts.templates["tp_pnl"](n=i, gross=fmt_money(res.tp_gross[i-1],number_format), net=fmt_money(res.tp_net[i-1],number_format))
+
+    def _blended_line(self, res, number_format: str):
+        """Blended P&L of the scale-out plan, None while no close fractions are set."""
+        if len(self._tp_fractions) != len(res.tp_prices) or not any(self._tp_fractions):
+            return None
+        ladder = blend_tp_exits(res, self._tp_fractions)
+        return self.texts.templates["blended_pnl"](
+            closed=fmt_num(ladder.closed_fraction * 100, 1, number_format),
+            gross=fmt_money(ladder.blended_gross, number_format), net=fmt_money(ladder.blended_net, number_format))
+
+    def _render_stages(self, res, stages, number_format: str):
+        """Refresh only the outputs of the recalculated stages (see position_engine.recalc_graph)."""
+        lines_changed = False
+        for stage in stages:
+            if stage == "core":
+                self._set_result("nominal", fmt_money(res.nominal, number_format))
+                self._set_result("sl_price", fmt_num(res.sl_price, 6, number_format))
+            elif stage == "margin":
+                self._set_result("margin", fmt_money(res.margin, number_format))
+            elif stage == "fees":
+                self._extra_lines[0] = self._fees_line(res, number_format); lines_changed = True
+            elif stage == "risk":  # core, fees or leverage changed - liquidation depends on the same
+                self._extra_lines[1] = self._risk_line(res, number_format)
+                self._extra_lines[2] = self._liq_line(res, number_format); lines_changed = True
+            elif stage == "sl_pnl":
+                self._extra_lines[4] = self._sl_line(res, number_format); lines_changed = True
+            elif stage.endswith("_pnl"):
+                i = int(stage[2:-4])
+                self._extra_lines[4 + i] = self._tp_line(res, i, number_format); lines_changed = True
+            elif stage == "blended":
+                self._extra_lines[-1] = self._blended_line(res, number_format); lines_changed = True
+            else:  # tpN price
+                i = int(stage[2:])
+                self._set_result(stage, fmt_num(res.tp_prices[i-1], 6, number_format))
+        if lines_changed:
+            self._render_extra()
+
+    # ---------- Live recalculation ----------
+    def _bind_live_inputs(self):
+        """Recalculate while typing: every input reports which engine input it feeds."""
+        entries = {
+            "entry_price": [self.e_price], "max_loss": [self.e_max_loss], "sl_percent": [self.e_sl_percent],
+        }  # TP ladder values are traced in add_tp_level
+        for name, widgets in entries.items():
+            for w in widgets:
+                w.bind('<KeyRelease>', lambda _e, n=name: self._schedule_recalc(n), add="+")
+        # Collapsed-section inputs are traced on their variables - their widgets may not exist yet
+        self.entry_side_var.trace_add("write", lambda *_a: self._schedule_recalc("entry_fee"))
+        self.exit_side_var.trace_add("write", lambda *_a: self._schedule_recalc("exit_fee"))
+        self.tp_mode_var.trace_add("write", lambda *_a: self._on_tp_mode_change())
+        self.direction_var.trace_add("write", lambda *_a: self._schedule_recalc("direction"))
+
+    def _on_tp_mode_change(self):
+        self.update_tp_visibility()
+        self._schedule_recalc("tp_mode", *(f"tp{i}_value" for i in range(1, len(self.tp_rows) + 1)))
+
+    def _schedule_recalc(self, *names):
+        """Collect changed inputs and recalculate once typing pauses."""
+        self._pending_inputs.update(names)
+        if self._recalc_after_id is not None:
+            self.after_cancel(self._recalc_after_id)
+        self._recalc_after_id = self.after(LIVE_RECALC_DELAY_MS, self._flush_recalc)
+
+    def _read_input(self, name: str, number_format: str):
+        """Read and parse a single engine input from its widget."""
+        if name == "direction":
+            return self.direction_var.get().lower()
+        if name == "leverage":
+            return self._current_leverage()
+        if name == "entry_fee":
+            return self.fee_for(self.entry_side_var.get())
+        if name == "exit_fee":
+            return self.fee_for(self.exit_side_var.get())
+        if name == "tp_mode":
+            return self.tp_mode_var.get()
+        if name.endswith("_value"):
+            i = int(name[2:-6])
+            r_var, p_var, _close_var = self.tp_rows[i-1]
+            return parse_num((r_var if self.tp_mode_var.get() == "R-Multiple" else p_var).get(), number_format)
+        widget = {"entry_price": self.e_price, "max_loss": self.e_max_loss, "sl_percent": self.e_sl_percent}[name]
+        return parse_num(widget.get(), number_format)
+
+    def _flush_recalc(self):
+        """Push pending input changes through the dependency graph and re-render what changed."""
+        self._recalc_after_id = None
+        names, self._pending_inputs = self._pending_inputs, set()
+        if self._live is None:
+            if self.e_price.get().strip():
+                self.calculate(quiet=True)
+            return
+        number_format = self._number_format()
+        pending = set(names)
+        try:
+            if "tp_close" in names:
+                names.discard("tp_close")
+                fractions = tuple(parse_num(close_var.get(), number_format) / 100.0 for _r_var, _p_var, close_var in self.tp_rows)
+                blend_tp_exits(self._live.result, fractions)  # validates before anything is committed
+            else:
+                fractions = self._tp_fractions
+            changes = {name: self._read_input(name, number_format) for name in names}
+            stages = self._live.update(**changes)
+        except (ValueError, ZeroDivisionError):
+            # Half-typed input - keep the last valid result, but keep the valid changes of this
+            # window pending too, or fixing the bad field would only recompute that field
+            self._pending_inputs |= pending
+            return
+        if fractions != self._tp_fractions or any(st.endswith("_pnl") and st != "sl_pnl" for st in stages):
+            self._tp_fractions = fractions
+            stages.append("blended")
+        if not stages:
+            return
+        res = self._last_result = self._live.result
+        if "core" in stages or "fees" in stages:
+            self._margin_preview = (leverage_sweep(res.direction, res.entry_price, res.max_loss, res.entry_fee, res.exit_fee,
+                                                   (res.sl_percent,)), res.sl_percent, number_format)
+        self._render_stages(res, stages, number_format)
+
+    def _rerender(self):
+        """Re-render the last result with the current number format and language."""
+        if self._last_result is None:
+            return
+        number_format = self._number_format()
+        self._render_result(self._last_result, number_format)
+        if self._margin_preview is not None:
+            grid, sl_percent, _ = self._margin_preview
+            self._margin_preview = (grid, sl_percent, number_format)
+            self._preview_margin(self._current_leverage())
+
+    # ---------- Actions ----------
+    def on_save_settings(self):
+        try:
+            number_format = self._number_format()
+            maker = parse_num(self.maker_var.get(), number_format)
+            taker = parse_num(self.taker_var.get(), number_format)
+            self.settings["maker_fee"] = maker
+            self.settings["taker_fee"] = taker
+            self.settings["number_format"] = number_format
+            self.settings["language"] = self.current_language
+            self.settings["leverage"] = self.leverage_var.get()  # Save current leverage
+            if not self.settings.flush():
+                messagebox.showwarning("Warning", f"Settings could not be saved:\n{self.settings.last_error}")
+                return
+            messagebox.showinfo(get_text("saved", self.current_language), get_text("saved", self.current_language))
+        except Exception as e:
+            messagebox.showerror(get_text("error", self.current_language), f"{get_text('invalid_input', self.current_language)}\n{e}")
+    
+    def _on_format_change(self, event=None):
+        """Handle number format change - re-render cached results, no recalculation."""
+        try:
+            number_format = self._number_format()
+            self.settings["number_format"] = number_format
+            self._rerender()
+        except Exception:
+            pass
+    
+    def _on_fee_tier_change(self, event=None):
+        """Other fee tier or discount: entry/exit fees change, everything downstream of them is recalculated."""
+        tier = self.fee_tier_var.get()
+        self.settings["fee_tier"] = "" if tier == get_text("fee_manual", self.current_language) else tier
+        self.settings["fee_discount"] = bool(self.fee_discount_var.get())
+        self._schedule_recalc("entry_fee", "exit_fee")
+
+    def _on_bracket_table_change(self, event=None):
+        """Other exchange/symbol brackets - only the liquidation line changes."""
+        self.settings["bracket_table"] = self.bracket_table_var.get()
+        self._rerender()
+
+    def _on_language_change(self, event=None):
+        """Handle language change and rebuild UI."""
+        try:
+            name = self.language_var.get()
+            new_language = next((lang for lang, n in self._languages.items() if n == name), self.current_language)
+            if new_language != self.current_language:
+                self.current_language = new_language
+                self.texts = texts(new_language)
+                self.settings["language"] = new_language
+                self._rerender()
+                # Show message that restart is needed
+                messagebox.showinfo(get_text("saved", self.current_language), 
+                                  "Please restart the application to apply language changes." if new_language == "english" else "Bitte starten Sie die Anwendung neu, um die Sprachänderungen zu übernehmen.")
+        except Exception:
+            pass
+
+    def _on_close(self):
+        """Write pending settings before the window goes away."""
+        self.settings.close()
+        self.destroy()
+
+    def _set_result(self, key: str, formatted: str):
+        """Show a formatted value - no Tk call if the label already shows it."""
+        if self._last_values.get(key) == formatted:
+            return
+        self.result_rows[key].label.config(text=formatted)
+        self._last_values[key] = formatted
+
+    def _render_extra(self):
+        """Join the P&L lines into the info label, only configured when the text changed."""
+        text = "\n".join(line for line in self._extra_lines if line is not None)
+        if self._last_values.get("extra") != text:
+            self.extra.config(text=text)
+            self._last_values["extra"] = text
@@ -0,0 +1,661 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Positions-Engine für den Nominalwert-Rechner
+Reine Berechnungslogik ohne Tkinter - nutzbar aus GUI, Web-Server und Skripten
+"""
+
+import sys
+from _thread import allocate_lock  # = threading.Lock, without importing threading
+from bisect import bisect_left
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+TP_MODE_R = "R-Multiple"
+TP_MODE_PERCENT = "Prozent"
+
+DEFAULT_TP_R = (1.0, 2.0, 3.0)
+DEFAULT_TP_PERCENT = (1.0, 2.0, 3.0)
+MAX_TP_LEVELS = 10
+
+# One mode for all TP levels, or one mode per level
+TPMode = Union[str, Sequence[str]]
+
+
+class PositionResult(NamedTuple):
+    """Raw numeric result of one position calculation (fees in %, amounts in account currency)."""
+    direction: str
+    entry_price: float
+    max_loss: float
+    sl_percent: float
+    leverage: float
+    nominal: float
+    margin: float
+    units: float
+    sl_price: float
+    sl_distance: float
+    tp_prices: Tuple[float, ...]
+    entry_fee: float
+    exit_fee: float
+    total_fee_pct: float
+    entry_fee_amt: float
+    exit_fee_amt: float
+    total_fees_amt: float
+    sl_gross: float
+    sl_net: float
+    tp_gross: Tuple[float, ...]
+    tp_net: Tuple[float, ...]
+
+    @property
+    def effective_risk_pct(self) -> float:
+        return self.sl_percent + self.total_fee_pct
+
+    def pnl_at(self, price: float) -> Tuple[float, float]:
+        """Gross and net P&L if the whole position is closed at price."""
+        if self.direction == "long":
+            gross = (price - self.entry_price) * self.units
+        else:
+            gross = (self.entry_price - price) * self.units
+        return gross, gross - self.total_fees_amt
+
+
+def normalize_direction(direction: str) -> str:
+    """Map 'Long'/'Short' (any case) to 'long'/'short'."""
+    d = direction.strip().lower()
+    if d not in ("long", "short"):
+        raise ValueError(f"Direction must be Long or Short, got {direction!r}.")
+    return d
+
+
+def tp_prices_for(direction: str, entry_price: float, sl_distance: float,
+                  tp_mode: TPMode, tp_values: Sequence[float]) -> Tuple[float, ...]:
+    """Take-profit prices from R multiples or percent distances (tp_mode per level or for all)."""
+    sgn = 1 if direction == "long" else -1
+    if not isinstance(tp_mode, str):
+        if len(tp_mode) != len(tp_values):
+            raise ValueError("Need one TP mode per TP level.")
+        return tuple((entry_price + sgn * (v * sl_distance)) if mode == TP_MODE_R else entry_price * (1.0 + sgn * v / 100.0)
+                     for mode, v in zip(tp_mode, tp_values))
+    if tp_mode == TP_MODE_R:
+        if direction == "long":
+            return tuple(entry_price + m * sl_distance for m in tp_values)
+        return tuple(entry_price - m * sl_distance for m in tp_values)
+    return tuple(entry_price * (1.0 + sgn * p / 100.0) for p in tp_values)
+
+
+def calculate_position(direction: str, entry_price: float, max_loss: float, sl_percent: float,
+                       leverage: float = 1, entry_fee: float = 0.0, exit_fee: float = 0.0,
+                       tp_mode: TPMode = TP_MODE_R, tp_values: Sequence[float] = DEFAULT_TP_R,
+                       fees_in_risk: bool = False) -> PositionResult:
+    """
+    Size a position so that hitting the stop loses max_loss.
+
+    Fees are given in percent of nominal. With fees_in_risk=True the fees are
+    part of the risk budget (nominal = max_loss / (sl% + fees%)), as in the
+    older Positionsrechner frontends. Any number of TP levels is accepted.
+    """
+    direction = normalize_direction(direction)
+    if entry_price <= 0: raise ValueError("Entry price must be > 0.")
+    if sl_percent <= 0:  raise ValueError("Stop-Loss % must be > 0.")
+
+    total_fee_pct = entry_fee + exit_fee
+    risk_pct = sl_percent + total_fee_pct if fees_in_risk else sl_percent
+
+    nominal = max_loss / (risk_pct / 100.0)
+    margin = nominal / leverage
+    units = nominal / entry_price
+
+    if direction == "long":
+        sl_price = entry_price * (1.0 - sl_percent / 100.0)
+    else:
+        sl_price = entry_price * (1.0 + sl_percent / 100.0)
+    sl_distance = abs(entry_price - sl_price)
+
+    tps = tp_prices_for(direction, entry_price, sl_distance, tp_mode, tp_values)
+
+    entry_fee_amt = nominal * (entry_fee / 100.0)
+    exit_fee_amt = nominal * (exit_fee / 100.0)
+    total_fees_amt = entry_fee_amt + exit_fee_amt
+
+    # P&L: long gains when price rises, short when it falls
+    if direction == "long":
+        sl_gross = (sl_price - entry_price) * units
+        tp_gross = tuple((p - entry_price) * units for p in tps)
+    else:
+        sl_gross = (entry_price - sl_price) * units
+        tp_gross = tuple((entry_price - p) * units for p in tps)
+    tp_net = tuple(g - total_fees_amt for g in tp_gross)
+
+    return PositionResult(
+        direction, entry_price, max_loss, sl_percent, leverage,
+        nominal, margin, units, sl_price, sl_distance, tps,
+        entry_fee, exit_fee, total_fee_pct, entry_fee_amt, exit_fee_amt, total_fees_amt,
+        sl_gross, sl_gross - total_fees_amt, tp_gross, tp_net,
+    )
+
+
+# ---------------- Result cache ----------------
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / (self.hits + self.misses) if self.hits or self.misses else 0.0
+
+
+class ResultCache:
+    """Bounded LRU with hit/miss/eviction counters; thread-safe for the threaded web server."""
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = allocate_lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get_or_compute(self, key, compute):
+        """Cached value for key, else compute() - errors are raised, not cached."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+        # Outside the lock: two threads missing the same key both compute the same result, which is harmless
+        value = compute()
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self.hits, self.misses, self.evictions, len(self._data), self.maxsize)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+# Shared by the GUI (calculate_ladder) and web_local's /api/calc within a process
+POSITION_CACHE = ResultCache(4096)
+
+
+def cached_position(direction: str, entry_price: float, max_loss: float, sl_percent: float,
+                    leverage: float = 1, entry_fee: float = 0.0, exit_fee: float = 0.0,
+                    tp_mode: TPMode = TP_MODE_R, tp_values: Sequence[float] = DEFAULT_TP_R,
+                    fees_in_risk: bool = False) -> PositionResult:
+    """
+    calculate_position through POSITION_CACHE. The key is the normalized inputs
+    (parsed numbers as floats, lower-case direction), so "65.000,5" typed in German
+    and 65000.5 from a bot share one entry. PositionResult is immutable, safe to share.
+    """
+    key = (normalize_direction(direction), float(entry_price), float(max_loss), float(sl_percent),
+           float(leverage), float(entry_fee), float(exit_fee),
+           tp_mode if isinstance(tp_mode, str) else tuple(tp_mode),
+           tuple(float(v) for v in tp_values), bool(fees_in_risk))
+    return POSITION_CACHE.get_or_compute(key, lambda: calculate_position(*key))
+
+
+# ---------------- Batch sizing ----------------
+# Below this many rows the NumPy setup cost outweighs the vectorized pass
+BATCH_NUMPY_MIN_ROWS = 64
+
+
+def batch_columns(n_tps: int, blended: bool = False) -> List[str]:
+    """Output column names of calculate_batch for n_tps take-profit levels."""
+    cols = ["nominal", "margin", "units", "sl_price", "sl_distance",
+            "total_fee_pct", "entry_fee_amt", "exit_fee_amt", "total_fees_amt",
+            "sl_gross", "sl_net"]
+    for i in range(1, n_tps + 1):
+        cols += [f"tp{i}", f"tp{i}_gross", f"tp{i}_net"]
+    if blended:
+        cols += ["blended_gross", "blended_net"]
+    return cols
+
+
+def result_row(res: PositionResult) -> Dict[str, float]:
+    """Flatten a PositionResult into the calculate_batch column layout."""
+    row = {
+        "nominal": res.nominal, "margin": res.margin, "units": res.units,
+        "sl_price": res.sl_price, "sl_distance": res.sl_distance,
+        "total_fee_pct": res.total_fee_pct, "entry_fee_amt": res.entry_fee_amt,
+        "exit_fee_amt": res.exit_fee_amt, "total_fees_amt": res.total_fees_amt,
+        "sl_gross": res.sl_gross, "sl_net": res.sl_net,
+    }
+    for i, (price, gross, net) in enumerate(zip(res.tp_prices, res.tp_gross, res.tp_net), start=1):
+        row[f"tp{i}"] = price
+        row[f"tp{i}_gross"] = gross
+        row[f"tp{i}_net"] = net
+    return row
+
+
+def side_fees(sides, maker_fee: float, taker_fee: float):
+    """Map a column (or scalar) of 'Maker'/'Taker' sides to fee percentages."""
+    if isinstance(sides, str):
+        return maker_fee if sides.lower() == "maker" else taker_fee
+    np = _loaded_numpy()
+    if np is not None and isinstance(sides, np.ndarray):
+        return np.where(np.char.lower(sides.astype(str)) == "maker", maker_fee, taker_fee)
+    return [maker_fee if s.lower() == "maker" else taker_fee for s in sides]
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """NumPy, imported on the first vectorized batch - not at import time. None if not installed."""
+    try:
+        import numpy
+    except ImportError:  # optional - batch sizing falls back to pure Python
+        return None
+    return numpy
+
+
+def _loaded_numpy():
+    """NumPy only if something already imported it - an ndarray input implies it was."""
+    return sys.modules.get("numpy")
+
+
+def _is_column(value) -> bool:
+    return not isinstance(value, (str, bytes)) and hasattr(value, "__len__")
+
+
+def _batch_len(columns) -> int:
+    n = None
+    for col in columns:
+        if _is_column(col):
+            if n is None:
+                n = len(col)
+            elif len(col) != n:
+                raise ValueError(f"Column length mismatch: {len(col)} != {n}.")
+    if n is None:
+        raise ValueError("calculate_batch needs at least one column input.")
+    return n
+
+
+def _at(value, i):
+    return value[i] if _is_column(value) else value
+
+
+def calculate_batch(direction, entry_price, max_loss, sl_percent, leverage=1,
+                    entry_fee=0.0, exit_fee=0.0, tp_mode=TP_MODE_R,
+                    tp_values: Sequence = DEFAULT_TP_R, fees_in_risk: bool = False,
+                    use_numpy=None, tp_fractions: Optional[Sequence[float]] = None) -> Dict[str, Sequence[float]]:
+    """
+    Size many trade plans at once.
+
+    Every input may be a column (list/array, one value per plan) or a scalar
+    shared by all plans; tp_values holds one such entry per TP level and
+    direction accepts 'long'/'short' strings or +1/-1. Returns a dict of
+    output columns named as in batch_columns(). With NumPy installed and at
+    least BATCH_NUMPY_MIN_ROWS plans the columns are computed in one
+    vectorized pass (ndarray outputs), otherwise row by row through
+    calculate_position (list outputs). Both paths give identical numbers.
+
+    tp_mode is one mode for all levels (scalar or per-plan column). With
+    tp_fractions (share of the position closed at each level, one per level)
+    blended_gross / blended_net columns of the scaled-out exit are added.
+    """
+    inputs = [direction, entry_price, max_loss, sl_percent, leverage, entry_fee, exit_fee, tp_mode, *tp_values]
+    n = _batch_len(inputs)
+    if tp_fractions is not None:
+        _check_fractions(tp_fractions, len(tp_values))
+    if use_numpy is None:
+        use_numpy = n >= BATCH_NUMPY_MIN_ROWS and _numpy() is not None
+    elif use_numpy and _numpy() is None:
+        raise RuntimeError("NumPy is not installed.")
+    if use_numpy:
+        np = _numpy()
+        out = _calculate_batch_numpy(n, direction, entry_price, max_loss, sl_percent, leverage,
+                                     entry_fee, exit_fee, tp_mode, tp_values, fees_in_risk)
+        if tp_fractions is not None:
+            out["blended_gross"] = sum(f * out[f"tp{i}_gross"] for i, f in enumerate(tp_fractions, start=1)) + np.zeros(n)
+            out["blended_net"] = sum(f * out[f"tp{i}_net"] for i, f in enumerate(tp_fractions, start=1)) + np.zeros(n)
+        return out
+
+    out = {col: [] for col in batch_columns(len(tp_values), tp_fractions is not None)}
+    appenders = [(col, lst.append) for col, lst in out.items()]
+    for i in range(n):
+        d = _at(direction, i)
+        if not isinstance(d, str):
+            d = "long" if d > 0 else "short"
+        try:
+            res = calculate_position(d, _at(entry_price, i), _at(max_loss, i), _at(sl_percent, i),
+                                     _at(leverage, i), _at(entry_fee, i), _at(exit_fee, i),
+                                     _at(tp_mode, i), [_at(v, i) for v in tp_values], fees_in_risk)
+        except ValueError as e:
+            raise ValueError(f"Row {i}: {e}") from None
+        row = result_row(res)
+        if tp_fractions is not None:
+            ladder = blend_tp_exits(res, tp_fractions)
+            row["blended_gross"], row["blended_net"] = ladder.blended_gross, ladder.blended_net
+        for col, append in appenders:
+            append(row[col])
+    return out
+
+
+def _direction_sign(direction, n):
+    """+1.0 for long, -1.0 for short, as a float column."""
+    np = _numpy()
+    if isinstance(direction, str):
+        return np.full(n, 1.0 if normalize_direction(direction) == "long" else -1.0)
+    arr = np.asarray(direction)
+    if arr.dtype.kind in "biuf":
+        return np.where(np.broadcast_to(arr, (n,)) > 0, 1.0, -1.0)
+    lowered = np.char.lower(np.char.strip(arr.astype(str)))
+    is_long = lowered == "long"
+    bad = ~(is_long | (lowered == "short"))
+    if bad.any():
+        i = int(np.argmax(bad))
+        raise ValueError(f"Row {i}: Direction must be Long or Short, got {arr[i]!r}.")
+    return np.where(is_long, 1.0, -1.0)
+
+
+def _calculate_batch_numpy(n, direction, entry_price, max_loss, sl_percent, leverage,
+                           entry_fee, exit_fee, tp_mode, tp_values, fees_in_risk):
+    np = _numpy()
+
+    def col(value):
+        return np.broadcast_to(np.asarray(value, dtype=float), (n,))
+
+    sign = _direction_sign(direction, n)
+    ep, ml, sl, lev = col(entry_price), col(max_loss), col(sl_percent), col(leverage)
+    ef, xf = col(entry_fee), col(exit_fee)
+
+    for bad, msg in ((ep <= 0, "Entry price must be > 0."), (sl <= 0, "Stop-Loss % must be > 0.")):
+        if bad.any():
+            raise ValueError(f"Row {int(np.argmax(bad))}: {msg}")
+
+    # Same operation order as calculate_position so results match bit for bit
+    total_fee_pct = ef + xf
+    risk_pct = sl + total_fee_pct if fees_in_risk else sl
+    nominal = ml / (risk_pct / 100.0)
+    margin = nominal / lev
+    units = nominal / ep
+    sl_price = ep * (1.0 - sign * sl / 100.0)
+    sl_distance = np.abs(ep - sl_price)
+
+    entry_fee_amt = nominal * (ef / 100.0)
+    exit_fee_amt = nominal * (xf / 100.0)
+    total_fees_amt = entry_fee_amt + exit_fee_amt
+    sl_gross = sign * (sl_price - ep) * units
+
+    out = {
+        "nominal": nominal, "margin": margin, "units": units,
+        "sl_price": sl_price, "sl_distance": sl_distance,
+        "total_fee_pct": total_fee_pct, "entry_fee_amt": entry_fee_amt,
+        "exit_fee_amt": exit_fee_amt, "total_fees_amt": total_fees_amt,
+        "sl_gross": sl_gross, "sl_net": sl_gross - total_fees_amt,
+    }
+
+    if isinstance(tp_mode, str):
+        r_rows = np.full(n, tp_mode == TP_MODE_R)
+    else:
+        r_rows = np.asarray(tp_mode).astype(str) == TP_MODE_R
+    for i, value in enumerate(tp_values, start=1):
+        v = col(value)
+        tp = np.where(r_rows, ep + sign * (v * sl_distance), ep * (1.0 + sign * v / 100.0))
+        gross = sign * (tp - ep) * units
+        out[f"tp{i}"] = tp
+        out[f"tp{i}_gross"] = gross
+        out[f"tp{i}_net"] = gross - total_fees_amt
+    return out
+
+
+# ---------------- Take-profit ladder ----------------
+class TPLevel(NamedTuple):
+    """One scale-out level: R multiple or percent distance, and the share of the position closed there."""
+    value: float
+    fraction: float = 0.0
+    mode: str = TP_MODE_R
+
+
+class LadderResult(NamedTuple):
+    """Per-level and blended P&L of a scaled-out exit (gross/net for the closed share only)."""
+    prices: Tuple[float, ...]
+    fractions: Tuple[float, ...]
+    gross: Tuple[float, ...]
+    net: Tuple[float, ...]
+    closed_fraction: float
+    blended_gross: float
+    blended_net: float
+
+
+def _check_fractions(fractions: Sequence[float], n_levels: int):
+    if len(fractions) != n_levels:
+        raise ValueError("Need one close fraction per TP level.")
+    if any(f < 0 or f > 1 for f in fractions):
+        raise ValueError("TP close fractions must be between 0 and 100%.")
+    if sum(fractions) > 1.0 + 1e-9:
+        raise ValueError("TP close fractions must add up to at most 100%.")
+
+
+def blend_tp_exits(res: PositionResult, fractions: Sequence[float]) -> LadderResult:
+    """
+    Blend the TP levels of res into one scaled-out exit.
+
+    Level i closes fractions[i] of the position; its share of the entry and
+    exit fees is charged with it. Any unclosed remainder is left out of the
+    blended P&L (see closed_fraction).
+    """
+    _check_fractions(fractions, len(res.tp_prices))
+    fractions = tuple(float(f) for f in fractions)
+    gross = tuple(f * g for f, g in zip(fractions, res.tp_gross))
+    net = tuple(f * n for f, n in zip(fractions, res.tp_net))
+    return LadderResult(res.tp_prices, fractions, gross, net, sum(fractions), sum(gross), sum(net))
+
+
+def calculate_ladder(direction: str, entry_price: float, max_loss: float, sl_percent: float,
+                     levels: Sequence[TPLevel], leverage: float = 1, entry_fee: float = 0.0,
+                     exit_fee: float = 0.0, fees_in_risk: bool = False) -> Tuple[PositionResult, LadderResult]:
+    """Size a position with an N-level TP ladder (per-level mode and close fraction); sizing is cached."""
+    if len(levels) > MAX_TP_LEVELS:
+        raise ValueError(f"At most {MAX_TP_LEVELS} TP levels.")
+    res = cached_position(direction, entry_price, max_loss, sl_percent, leverage, entry_fee, exit_fee,
+                             [lv.mode for lv in levels], [lv.value for lv in levels], fees_in_risk)
+    return res, blend_tp_exits(res, [lv.fraction for lv in levels])
+
+
+# ---------------- Leverage x stop-loss sweep ----------------
+LEVERAGE_RANGE = tuple(range(1, 126))
+
+
+class SweepGrid(NamedTuple):
+    """Nominal, margin and net stop-loss P&L for every (SL%, leverage) pair."""
+    sl_percents: Tuple[float, ...]
+    leverages: Tuple[int, ...]
+    nominal: Sequence[float]           # per SL%
+    net_sl_loss: Sequence[float]       # per SL%, net P&L at the stop (negative)
+    margin: Sequence[Sequence[float]]  # [SL% index][leverage index]
+
+    def lookup(self, sl_percent: float, leverage: int) -> Tuple[float, float, float]:
+        """(nominal, margin, net_sl_loss) for a grid point; KeyError if it is not on the grid."""
+        i = bisect_left(self.sl_percents, sl_percent)
+        j = bisect_left(self.leverages, leverage)
+        if i == len(self.sl_percents) or self.sl_percents[i] != sl_percent \
+                or j == len(self.leverages) or self.leverages[j] != leverage:
+            raise KeyError((sl_percent, leverage))
+        return float(self.nominal[i]), float(self.margin[i][j]), float(self.net_sl_loss[i])
+
+    def rows(self) -> Iterator[Tuple[float, int, float, float, float]]:
+        """Long-format rows (sl_percent, leverage, nominal, margin, net_sl_loss)."""
+        for i, sl in enumerate(self.sl_percents):
+            nominal, net, margins = float(self.nominal[i]), float(self.net_sl_loss[i]), self.margin[i]
+            for j, lev in enumerate(self.leverages):
+                yield sl, lev, nominal, float(margins[j]), net
+
+
+def sl_range(start: float, stop: float, step: float) -> Tuple[float, ...]:
+    """Inclusive SL% range, rounded to 6 decimals to avoid float drift."""
+    if step <= 0: raise ValueError("Step must be > 0.")
+    if start <= 0: raise ValueError("Stop-Loss % must be > 0.")
+    count = int((stop - start) / step + 1e-9) + 1
+    return tuple(round(start + k * step, 6) for k in range(max(count, 0)))
+
+
+def leverage_sweep(direction: str, entry_price: float, max_loss: float,
+                   entry_fee: float = 0.0, exit_fee: float = 0.0,
+                   sl_percents: Sequence[float] = (1.0,), leverages: Sequence[int] = LEVERAGE_RANGE,
+                   fees_in_risk: bool = False) -> SweepGrid:
+    """
+    Size every (SL%, leverage) combination for one entry / max-loss / fee setup.
+
+    Results are cached per input set, so repeated lookups while dragging the
+    leverage slider never recompute the grid. Values match calculate_position.
+    """
+    sl_key = tuple(sorted(set(float(v) for v in sl_percents)))
+    lev_key = tuple(sorted(set(int(v) for v in leverages)))
+    return _leverage_sweep_cached(normalize_direction(direction), float(entry_price), float(max_loss),
+                                  float(entry_fee), float(exit_fee), sl_key, lev_key, bool(fees_in_risk))
+
+
+@lru_cache(maxsize=64)
+def _leverage_sweep_cached(direction, entry_price, max_loss, entry_fee, exit_fee,
+                           sl_percents, leverages, fees_in_risk) -> SweepGrid:
+    if not sl_percents or not leverages:
+        raise ValueError("Sweep needs at least one SL% and one leverage.")
+    if entry_price <= 0: raise ValueError("Entry price must be > 0.")
+    if sl_percents[0] <= 0: raise ValueError("Stop-Loss % must be > 0.")
+    # Nominal and stop-loss P&L depend only on SL%; margin is nominal / leverage
+    cols = calculate_batch(direction, entry_price, max_loss, list(sl_percents), 1,
+                           entry_fee, exit_fee, TP_MODE_R, (), fees_in_risk)
+    nominal, net = cols["nominal"], cols["sl_net"]
+    np = _loaded_numpy()
+    if np is not None and isinstance(nominal, np.ndarray):
+        margin = np.divide.outer(nominal, np.asarray(leverages, dtype=float))
+        for arr in (nominal, net, margin):
+            arr.setflags(write=False)  # shared through the cache
+    else:
+        nominal, net = tuple(nominal), tuple(net)
+        margin = tuple(tuple(n / lev for lev in leverages) for n in nominal)
+    return SweepGrid(sl_percents, leverages, nominal, net, margin)
+
+
+# ---------------- Incremental recalculation ----------------
+def recalc_graph(n_tps: int, fees_in_risk: bool = False) -> Dict[str, Tuple[str, ...]]:
+    """
+    Stage -> inputs/stages it reads, in topological order.
+
+    core: nominal, units, SL price/distance, SL gross; margin: nominal/leverage;
+    fees: fee % and amounts; risk: effective risk line; tpN: TP price and gross;
+    sl_pnl / tpN_pnl: net P&L lines.
+    """
+    core = ("direction", "entry_price", "max_loss", "sl_percent")
+    if fees_in_risk:
+        core += ("entry_fee", "exit_fee")
+    graph = {
+        "core": core,
+        "margin": ("core", "leverage"),
+        "fees": ("core", "entry_fee", "exit_fee"),
+        "risk": ("core", "fees", "leverage"),
+        "sl_pnl": ("core", "fees"),
+    }
+    for i in range(1, n_tps + 1):
+        graph[f"tp{i}"] = ("core", "tp_mode", f"tp{i}_value")
+        graph[f"tp{i}_pnl"] = (f"tp{i}", "fees")
+    return graph
+
+
+def affected_stages(graph: Dict[str, Tuple[str, ...]], changed: Iterable[str]) -> List[str]:
+    """Stages that must rerun after the given inputs changed, in graph order."""
+    dirty = set(changed)
+    stages = []
+    for stage, deps in graph.items():
+        if not dirty.isdisjoint(deps):
+            dirty.add(stage)
+            stages.append(stage)
+    return stages
+
+
+class IncrementalPosition:
+    """
+    Holds the last PositionResult and recomputes only the stages whose inputs changed.
+
+    update() takes any of direction, entry_price, max_loss, sl_percent, leverage,
+    entry_fee, exit_fee, tp_mode and tpN_value and returns the rerun stage names
+    (see recalc_graph), so a UI can refresh just the affected outputs. Numbers
+    are identical to a fresh calculate_position call with the same inputs.
+    """
+
+    def __init__(self, result: PositionResult, tp_mode: TPMode, tp_values: Sequence[float], fees_in_risk: bool = False):
+        self.result = result
+        self.fees_in_risk = fees_in_risk
+        self.inputs = {
+            "direction": result.direction, "entry_price": result.entry_price, "max_loss": result.max_loss,
+            "sl_percent": result.sl_percent, "leverage": result.leverage,
+            "entry_fee": result.entry_fee, "exit_fee": result.exit_fee, "tp_mode": tp_mode,
+        }
+        for i, v in enumerate(tp_values, start=1):
+            self.inputs[f"tp{i}_value"] = v
+        self.graph = recalc_graph(len(tp_values), fees_in_risk)
+
+    def update(self, **changes) -> List[str]:
+        unknown = set(changes) - set(self.inputs)
+        if unknown:
+            raise KeyError(f"Unknown input(s): {', '.join(sorted(unknown))}")
+        changed = [k for k, v in changes.items() if self.inputs[k] != v]
+        if not changed:
+            return []
+        inp = {**self.inputs, **changes}
+        stages = affected_stages(self.graph, changed)
+        r = self.result
+        f = {}  # new field values, committed only if every stage succeeds
+
+        if "core" in stages:
+            direction = normalize_direction(inp["direction"])
+            entry_price, sl_percent = inp["entry_price"], inp["sl_percent"]
+            if entry_price <= 0: raise ValueError("Entry price must be > 0.")
+            if sl_percent <= 0:  raise ValueError("Stop-Loss % must be > 0.")
+            risk_pct = sl_percent + (inp["entry_fee"] + inp["exit_fee"]) if self.fees_in_risk else sl_percent
+            nominal = inp["max_loss"] / (risk_pct / 100.0)
+            units = nominal / entry_price
+            if direction == "long":
+                sl_price = entry_price * (1.0 - sl_percent / 100.0)
+                sl_gross = (sl_price - entry_price) * units
+            else:
+                sl_price = entry_price * (1.0 + sl_percent / 100.0)
+                sl_gross = (entry_price - sl_price) * units
+            f.update(direction=direction, entry_price=entry_price, max_loss=inp["max_loss"], sl_percent=sl_percent,
+                     nominal=nominal, units=units, sl_price=sl_price,
+                     sl_distance=abs(entry_price - sl_price), sl_gross=sl_gross)
+        cur = r._replace(**f) if f else r
+
+        if "margin" in stages:
+            f.update(leverage=inp["leverage"], margin=cur.nominal / inp["leverage"])
+        if "fees" in stages:
+            entry_fee, exit_fee = inp["entry_fee"], inp["exit_fee"]
+            entry_fee_amt = cur.nominal * (entry_fee / 100.0)
+            exit_fee_amt = cur.nominal * (exit_fee / 100.0)
+            f.update(entry_fee=entry_fee, exit_fee=exit_fee, total_fee_pct=entry_fee + exit_fee,
+                     entry_fee_amt=entry_fee_amt, exit_fee_amt=exit_fee_amt,
+                     total_fees_amt=entry_fee_amt + exit_fee_amt)
+        total_fees_amt = f.get("total_fees_amt", cur.total_fees_amt)
+        if "sl_pnl" in stages:
+            f["sl_net"] = cur.sl_gross - total_fees_amt
+
+        prices, gross, net = list(cur.tp_prices), list(cur.tp_gross), list(cur.tp_net)
+        for i in range(len(prices)):
+            if f"tp{i + 1}" in stages:
+                mode = inp["tp_mode"] if isinstance(inp["tp_mode"], str) else inp["tp_mode"][i]
+                prices[i], = tp_prices_for(cur.direction, cur.entry_price, cur.sl_distance,
+                                           mode, (inp[f"tp{i + 1}_value"],))
+                diff = prices[i] - cur.entry_price
+                gross[i] = diff * cur.units if cur.direction == "long" else -diff * cur.units
+            if f"tp{i + 1}_pnl" in stages:
+                net[i] = gross[i] - total_fees_amt
+        if any(s.startswith("tp") for s in stages):
+            f.update(tp_prices=tuple(prices), tp_gross=tuple(gross), tp_net=tuple(net))
+
+        self.result = r._replace(**f)
+        self.inputs = inp
+        return stages
@@ -5,7 +5,8 @@ from cx_Freeze import setup, Executable
 build_options = {
     'packages': ['tkinter', 'PIL'],
     'excludes': ['matplotlib', 'numpy', 'scipy'],
-    'include_files': [('logo.png', 'logo.png')] if os.path.exists('logo.png') else []
+    'include_files': ([('logo.png', 'logo.png')] if os.path.exists('logo.png') else [])
+                     + [('maintenance_brackets.json', 'maintenance_brackets.json'), ('fee_schedule.json', 'fee_schedule.json'), ('locales', 'locales')]
 }
 
 base = 'Win32GUI' if sys.platform == 'win32' else None
@@ -1,6 +1,8 @@
 import os, json, tkinter as tk
 from tkinter import ttk, messagebox
 
+from position_engine import calculate_position
+
 # ---------------- Storage ----------------
 def appdata_dir():
     base = os.getenv("APPDATA") or os.path.dirname(os.path.abspath(__file__))
@@ -291,65 +293,38 @@ class App(tk.Tk):
             max_loss    = parse_num(self.e_loss.get())
             sl_percent  = parse_num(self.e_sl.get())
             leverage    = self._current_leverage()
-            if entry_price <= 0: raise ValueError("Entry price must be > 0.")
-            if sl_percent <= 0:  raise ValueError("Stop-Loss % must be > 0.")
 
             entry_fee = self.fee_for(self.cb_entry_side.get())
             exit_fee  = self.fee_for(self.cb_exit_side.get())
-            total_fee_pct = entry_fee + exit_fee
-
-            effective_pct = (sl_percent + total_fee_pct) / 100.0
-            nominal = max_loss / effective_pct
-            margin_required = nominal / leverage
-            units = nominal / entry_price
-
-            # SL price & distance
-            sl_price = entry_price * (1.0 - sl_percent/100.0) if direction == "long" else entry_price * (1.0 + sl_percent/100.0)
-            sl_distance = abs(entry_price - sl_price)
 
             # TPs
             mode = self.cb_tp_mode.get()
             if mode == "R-Multiple":
-                tp1r = parse_num(self.e_tp1r.get()); tp2r = parse_num(self.e_tp2r.get()); tp3r = parse_num(self.e_tp3r.get())
-                tps = [(entry_price + m*sl_distance) if direction=="long" else (entry_price - m*sl_distance) for m in [tp1r, tp2r, tp3r]]
+                tp_values = [parse_num(w.get()) for w in (self.e_tp1r, self.e_tp2r, self.e_tp3r)]
             else:
-                tp1p = parse_num(self.e_tp1p.get()); tp2p = parse_num(self.e_tp2p.get()); tp3p = parse_num(self.e_tp3p.get())
-                sgn = 1 if direction=="long" else -1
-                tps = [entry_price*(1.0 + sgn*tp1p/100.0),
-                       entry_price*(1.0 + sgn*tp2p/100.0),
-                       entry_price*(1.0 + sgn*tp3p/100.0)]
-            tp1, tp2, tp3 = tps
-
-            # Fees in €
-            entry_fee_amt = nominal * (entry_fee/100.0)
-            exit_fee_amt  = nominal * (exit_fee/100.0)
-            total_fees_amt = entry_fee_amt + exit_fee_amt
-
-            # P&L
-            def pnl_at(price: float):
-                gross = (price - entry_price)*units if direction=="long" else (entry_price - price)*units
-                return gross, gross - total_fees_amt
-
-            sl_gross, sl_net = pnl_at(sl_price)
-            tp1_gross, tp1_net = pnl_at(tp1)
-            tp2_gross, tp2_net = pnl_at(tp2)
-            tp3_gross, tp3_net = pnl_at(tp3)
+                tp_values = [parse_num(w.get()) for w in (self.e_tp1p, self.e_tp2p, self.e_tp3p)]
+
+            # Fees are part of the risk budget here
+            res = calculate_position(direction, entry_price, max_loss, sl_percent, leverage,
+                                     entry_fee, exit_fee, mode, tp_values, fees_in_risk=True)
+            tp1, tp2, tp3 = res.tp_prices
+            (tp1_gross, tp2_gross, tp3_gross), (tp1_net, tp2_net, tp3_net) = res.tp_gross, res.tp_net
 
             # Big outputs
-            self._set_result(self.lbl_nominal, "Nominal (€)", fmt_money(nominal), "nominal")
-            self._set_result(self.lbl_units,   "Stückzahl",    fmt_num(units, 4), "units")
-            self._set_result(self.lbl_slp,     "SL-Preis",     fmt_num(sl_price, 6), "sl_price")
+            self._set_result(self.lbl_nominal, "Nominal (€)", fmt_money(res.nominal), "nominal")
+            self._set_result(self.lbl_units,   "Stückzahl",    fmt_num(res.units, 4), "units")
+            self._set_result(self.lbl_slp,     "SL-Preis",     fmt_num(res.sl_price, 6), "sl_price")
             self._set_result(self.lbl_tp1,     "TP1",          fmt_num(tp1, 6), "tp1")
             self._set_result(self.lbl_tp2,     "TP2",          fmt_num(tp2, 6), "tp2")
             self._set_result(self.lbl_tp3,     "TP3",          fmt_num(tp3, 6), "tp3")
-            self._set_result(self.lbl_margin,  "Margin (€)",   fmt_money(margin_required), "margin")
+            self._set_result(self.lbl_margin,  "Margin (€)",   fmt_money(res.margin), "margin")
 
             lines = [
-                f"Gebühren: Entry {fmt_num(entry_fee,3)}% + Exit {fmt_num(exit_fee,3)}% = {fmt_num(total_fee_pct,3)}% "
-                f"(≈ {fmt_money(entry_fee_amt)} + {fmt_money(exit_fee_amt)} = {fmt_money(total_fees_amt)})",
-                f"Effektives Risiko: {fmt_num(sl_percent + total_fee_pct,3)}%   •   Hebel: {int(leverage)}×",
+                f"Gebühren: Entry {fmt_num(res.entry_fee,3)}% + Exit {fmt_num(res.exit_fee,3)}% = {fmt_num(res.total_fee_pct,3)}% "
+                f"(≈ {fmt_money(res.entry_fee_amt)} + {fmt_money(res.exit_fee_amt)} = {fmt_money(res.total_fees_amt)})",
+                f"Effektives Risiko: {fmt_num(res.effective_risk_pct,3)}%   •   Hebel: {int(leverage)}×",
                 "",
-                f"SL  → Brutto: {fmt_money(sl_gross)}   | Netto: {fmt_money(sl_net)}",
+                f"SL  → Brutto: {fmt_money(res.sl_gross)}   | Netto: {fmt_money(res.sl_net)}",
                 f"TP1 → Brutto: {fmt_money(tp1_gross)}  | Netto: {fmt_money(tp1_net)}",
                 f"TP2 → Brutto: {fmt_money(tp2_gross)}  | Netto: {fmt_money(tp2_net)}",
                 f"TP3 → Brutto: {fmt_money(tp3_gross)}  | Netto: {fmt_money(tp3_net)}",
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""CSV-Batch: jede Ausgabe muss unter ihrer Kopfzeile landen, auch bei kurzen oder kaputten Zeilen"""
+
+import csv, os, sys, tempfile, unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from nominalwert_rechner import run_batch_csv
+
+
+class BatchColumnAlignment(unittest.TestCase):
+    HEADER = ["direction", "entry_price", "max_loss", "sl_percent", "leverage", "entry_side"]
+
+    def run_rows(self, rows):
+        with tempfile.TemporaryDirectory() as d:
+            src, out = os.path.join(d, "in.csv"), os.path.join(d, "out.csv")
+            with open(src, "w", newline="", encoding="utf-8") as f:
+                csv.writer(f).writerows([self.HEADER] + rows)
+            run_batch_csv(src, out, number_format="us", maker_fee=0.02, taker_fee=0.05)
+            with open(out, newline="", encoding="utf-8") as f:
+                header, *result = list(csv.reader(f))
+        self.assertTrue(all(len(r) == len(header) for r in result), "every row as wide as the header")
+        return [dict(zip(header, r)) for r in result]
+
+    def test_short_row_is_padded(self):
+        full, short = self.run_rows([["long", "100", "10", "1", "1", "Taker"], ["long", "100", "10", "1"]])
+        self.assertEqual(short["leverage"], "")
+        self.assertEqual(short["nominal"], "1,000.00")
+        self.assertEqual(short["error"], "")
+        self.assertEqual({k: v for k, v in short.items() if k not in ("leverage", "entry_side")},
+                         {k: v for k, v in full.items() if k not in ("leverage", "entry_side")})
+
+    def test_malformed_rows_keep_error_in_error_column(self):
+        bad_number, too_short, too_long = self.run_rows([
+            ["long", "abc", "10", "1", "1", "Taker"],
+            ["short", "100"],
+            ["long", "100", "10", "1", "1", "Taker", "extra", "cells"],
+        ])
+        self.assertIn("abc", bad_number["error"])
+        self.assertEqual(bad_number["nominal"], "")
+        self.assertEqual(too_short["direction"], "short")
+        self.assertEqual(too_short["nominal"], "")
+        self.assertNotEqual(too_short["error"], "")
+        self.assertEqual(too_long["nominal"], "1,000.00")
+        self.assertEqual(too_long["error"], "")
+
+
+if __name__ == "__main__":
+    unittest.main()
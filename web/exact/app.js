@@ -0,0 +1,366 @@
+// Translation system
+const translations = {
+    german: {
+        title: "💹 Nominalwert-Rechner",
+        basic_settings: "📊 Basis-Einstellungen",
+        direction: "Richtung:",
+        long: "📈 Long",
+        short: "📉 Short",
+        entry_price: "Einstiegskurs:",
+        max_loss: "Max. Verlust (€):",
+        stop_loss: "Stop-Loss (%):",
+        results: "📈 Berechnungsergebnisse",
+        nominal: "Nominal",
+        margin: "Margin",
+        sl_price: "Stop-Loss",
+        tp1: "TP1",
+        tp2: "TP2",
+        tp3: "TP3",
+        calculate: "🚀 Berechnen",
+        number_format: "Zahlenformat:",
+        language: "Sprache:"
+    },
+    english: {
+        title: "💹 Nominal Value Calculator",
+        basic_settings: "📊 Basic Settings",
+        direction: "Direction:",
+        long: "📈 Long",
+        short: "📉 Short",
+        entry_price: "Order Price:",
+        max_loss: "Max. Loss (€):",
+        stop_loss: "Stop-Loss (%):",
+        results: "📈 Calculation Results",
+        nominal: "Nominal Value",
+        margin: "Margin",
+        sl_price: "Stop-Loss",
+        tp1: "TP1",
+        tp2: "TP2",
+        tp3: "TP3",
+        calculate: "🚀 Calculate",
+        number_format: "Number Format:",
+        language: "Language:"
+    }
+};
+
+let currentLanguage = 'german';
+let currentNumberFormat = 'german';
+let settings = {
+    makerFee: 0.014,
+    takerFee: 0.042,
+    numberFormat: 'german',
+    language: 'german'
+};
+
+// Load settings from localStorage
+function loadSettings() {
+    const saved = localStorage.getItem('nominalwert-settings');
+    if (saved) {
+        settings = {...settings, ...JSON.parse(saved)};
+        currentLanguage = settings.language;
+        currentNumberFormat = settings.numberFormat;
+
+        // Apply settings to UI
+        document.getElementById('makerFee').value = settings.makerFee;
+        document.getElementById('takerFee').value = settings.takerFee;
+        document.getElementById('numberFormat').value = settings.numberFormat;
+        document.getElementById('language').value = settings.language;
+
+        updateLanguageUI();
+    }
+}
+
+// Save settings to localStorage
+function saveSettings() {
+    settings.makerFee = parseFloat(document.getElementById('makerFee').value) || 0.014;
+    settings.takerFee = parseFloat(document.getElementById('takerFee').value) || 0.042;
+    settings.numberFormat = document.getElementById('numberFormat').value;
+    settings.language = document.getElementById('language').value;
+
+    localStorage.setItem('nominalwert-settings', JSON.stringify(settings));
+
+    currentLanguage = settings.language;
+    currentNumberFormat = settings.numberFormat;
+
+    alert(currentLanguage === 'german' ? 'Einstellungen gespeichert.' : 'Settings saved.');
+    updateLanguageUI();
+}
+
+// Update language UI
+function updateLanguageUI() {
+    document.body.className = `lang-${currentLanguage.substring(0,2)}`;
+
+    // Update all text elements
+    document.querySelectorAll('[data-text]').forEach(el => {
+        const key = el.getAttribute('data-text');
+        if (translations[currentLanguage] && translations[currentLanguage][key]) {
+            el.textContent = translations[currentLanguage][key];
+        }
+    });
+}
+
+// Number formatting functions
+function parseNumber(str) {
+    if (!str) return 0;
+
+    // Convert to string and clean
+    const cleanStr = str.toString().trim().replace(/\s/g, '');
+
+    // For numbers like 4,449.62 - always treat comma as thousands separator when dot follows
+    const result = parseFloat(cleanStr.replace(/,/g, ''));
+
+    return isNaN(result) ? 0 : result;
+}
+
+function formatNumber(value, decimals = 2) {
+    // Always format as plain number with dots for decimals
+    return value.toFixed(decimals);
+}
+
+// UI Functions
+function updateDirection() {
+    const longBtn = document.querySelector('.radio-btn.long');
+    const shortBtn = document.querySelector('.radio-btn.short');
+    const selected = document.querySelector('input[name="direction"]:checked').value;
+
+    if (selected === 'long') {
+        longBtn.classList.add('selected');
+        shortBtn.classList.remove('selected');
+    } else {
+        shortBtn.classList.add('selected');
+        longBtn.classList.remove('selected');
+    }
+}
+
+function updateLeverage() {
+    const value = document.getElementById('leverageSlider').value;
+    document.getElementById('leverageDisplay').textContent = value + 'X';
+}
+
+function setLeverage(value) {
+    document.getElementById('leverageSlider').value = value;
+    updateLeverage();
+}
+
+function toggleCollapsible(button) {
+    const content = button.nextElementSibling;
+    const isOpen = content.classList.contains('active');
+
+    if (isOpen) {
+        content.classList.remove('active');
+        button.textContent = button.textContent.replace('▼', '▶');
+    } else {
+        content.classList.add('active');
+        button.textContent = button.textContent.replace('▶', '▼');
+    }
+}
+
+function updateTPMode() {
+    const mode = document.getElementById('tpMode').value;
+    const rMultiple = document.getElementById('tpRMultiple');
+    const percent = document.getElementById('tpPercent');
+
+    if (mode === 'r-multiple') {
+        rMultiple.style.display = 'grid';
+        percent.style.display = 'none';
+    } else {
+        rMultiple.style.display = 'none';
+        percent.style.display = 'grid';
+    }
+}
+
+function updateNumberFormat() {
+    currentNumberFormat = document.getElementById('numberFormat').value;
+}
+
+function updateLanguage() {
+    currentLanguage = document.getElementById('language').value;
+    updateLanguageUI();
+}
+
+function handleEnter(event) {
+    if (event.key === 'Enter') {
+        calculate();
+    }
+}
+
+function formatInputNumber(input) {
+    let value = input.value;
+    if (!value) return;
+
+    // Remove all commas first
+    let cleaned = value.replace(/,/g, '');
+
+    // If it's a valid number, update the input
+    if (!isNaN(parseFloat(cleaned))) {
+        input.value = cleaned;
+    }
+}
+
+function resetInputs() {
+    document.getElementById('entryPrice').value = '';
+    document.getElementById('maxLoss').value = '10.00';
+    document.getElementById('stopLoss').value = '0.51';
+    document.querySelector('input[name="direction"][value="long"]').checked = true;
+    updateDirection();
+    setLeverage(1);
+
+    // Clear results
+    ['nominalResult', 'marginResult', 'slResult', 'tp1Result', 'tp2Result', 'tp3Result'].forEach(id => {
+        document.getElementById(id).textContent = '0.00';
+    });
+    document.getElementById('pnlInfo').textContent = '';
+}
+
+// Main calculation function
+function calculate() {
+    try {
+        const plan = readPlan();
+        // Served by web_local.py the Python engine calculates (same numbers as desktop and bots);
+        // opened as a file, or without the API (static hosting), the same formulas run here
+        if (location.protocol.startsWith('http')) {
+            calculateRemote(plan)
+                .catch(error => {
+                    if (error.fromApi) throw error;
+                    return calculateLocal(plan);
+                })
+                .then(res => showResults(plan, res))
+                .catch(error => alert(`Fehler: ${error.message}`));
+        } else {
+            showResults(plan, calculateLocal(plan));
+        }
+    } catch (error) {
+        alert(`Fehler: ${error.message}`);
+    }
+}
+
+// Inputs in the /api/calc plan format (fees in %, TP mode names of position_engine)
+function readPlan() {
+    const entryPrice = parseNumber(document.getElementById('entryPrice').value);
+    const maxLoss = parseNumber(document.getElementById('maxLoss').value);
+    const stopLossPercent = parseNumber(document.getElementById('stopLoss').value);
+
+    if (entryPrice <= 0) throw new Error('Entry price must be > 0');
+    if (stopLossPercent <= 0) throw new Error('Stop-Loss % must be > 0');
+    if (maxLoss <= 0) throw new Error('Max Loss must be > 0');
+
+    const entrySide = document.getElementById('entrySide').value;
+    const exitSide = document.getElementById('exitSide').value;
+    const rMultiple = document.getElementById('tpMode').value === 'r-multiple';
+    const tpIds = rMultiple ? ['tp1r', 'tp2r', 'tp3r'] : ['tp1p', 'tp2p', 'tp3p'];
+    return {
+        direction: document.querySelector('input[name="direction"]:checked').value,
+        entry_price: entryPrice,
+        max_loss: maxLoss,
+        sl_percent: stopLossPercent,
+        leverage: parseInt(document.getElementById('leverageSlider').value),
+        entry_fee: entrySide === 'Maker' ? settings.makerFee : settings.takerFee,
+        exit_fee: exitSide === 'Maker' ? settings.makerFee : settings.takerFee,
+        tp_mode: rMultiple ? 'R-Multiple' : 'Prozent',
+        tp_values: tpIds.map(id => parseNumber(document.getElementById(id).value))
+    };
+}
+
+function calculateRemote(plan) {
+    return fetch('/api/calc', {method: 'POST', headers: {'Content-Type': 'application/json'},
+                               body: JSON.stringify(plan)})
+        .then(response => {
+            if (response.status === 400) {
+                return response.json().then(res => {
+                    const error = new Error(res.error);
+                    error.fromApi = true;  // invalid input: show it, don't fall back
+                    throw error;
+                });
+            }
+            if (!response.ok) throw new Error('No calculation API');
+            return response.json();
+        });
+}
+
+// Offline fallback: position_engine.calculate_position, same field names as /api/calc
+function calculateLocal(plan) {
+    const sign = plan.direction === 'long' ? 1 : -1;
+    const totalFeePct = plan.entry_fee + plan.exit_fee;
+    const nominal = plan.max_loss / (plan.sl_percent / 100);
+    const units = nominal / plan.entry_price;
+    const slPrice = plan.entry_price * (1 - sign * plan.sl_percent / 100);
+    const slDistance = Math.abs(plan.entry_price - slPrice);
+    const fees = nominal * (plan.entry_fee / 100) + nominal * (plan.exit_fee / 100);
+    const pnl = price => sign * (price - plan.entry_price) * units;
+
+    const res = {
+        nominal: nominal,
+        margin: nominal / plan.leverage,
+        sl_price: slPrice,
+        total_fee_pct: totalFeePct,
+        effective_risk_pct: plan.sl_percent + totalFeePct,
+        sl_gross: pnl(slPrice),
+        sl_net: pnl(slPrice) - fees
+    };
+    plan.tp_values.forEach((value, i) => {
+        const tp = plan.tp_mode === 'R-Multiple'
+            ? plan.entry_price + sign * value * slDistance
+            : plan.entry_price * (1 + sign * value / 100);
+        res[`tp${i + 1}`] = tp;
+        res[`tp${i + 1}_gross`] = pnl(tp);
+        res[`tp${i + 1}_net`] = pnl(tp) - fees;
+    });
+    return res;
+}
+
+function showResults(plan, res) {
+    document.getElementById('nominalResult').textContent = formatNumber(res.nominal);
+    document.getElementById('marginResult').textContent = formatNumber(res.margin);
+    document.getElementById('slResult').textContent = formatNumber(res.sl_price, 6);
+    document.getElementById('tp1Result').textContent = formatNumber(res.tp1, 6);
+    document.getElementById('tp2Result').textContent = formatNumber(res.tp2, 6);
+    document.getElementById('tp3Result').textContent = formatNumber(res.tp3, 6);
+
+    // Update P&L info
+    const pnlText = [
+        `Gebühren: Entry ${formatNumber(plan.entry_fee, 3)}% + Exit ${formatNumber(plan.exit_fee, 3)}% = ${formatNumber(res.total_fee_pct, 3)}%`,
+        `Effektives Risiko: ${formatNumber(res.effective_risk_pct, 3)}% • Hebel: ${plan.leverage}×`,
+        '',
+        `SL → Brutto: ${formatNumber(res.sl_gross)} | Netto: ${formatNumber(res.sl_net)}`,
+        `TP1 → Brutto: ${formatNumber(res.tp1_gross)} | Netto: ${formatNumber(res.tp1_net)}`,
+        `TP2 → Brutto: ${formatNumber(res.tp2_gross)} | Netto: ${formatNumber(res.tp2_net)}`,
+        `TP3 → Brutto: ${formatNumber(res.tp3_gross)} | Netto: ${formatNumber(res.tp3_net)}`
+    ].join('\n');
+
+    document.getElementById('pnlInfo').textContent = pnlText;
+}
+
+// Copy to clipboard with feedback
+function copyResult(elementId) {
+    const element = document.getElementById(elementId);
+    let text = element.textContent;
+
+    // Parse and reformat the number to ensure correct format
+    const numValue = parseNumber(text);
+    text = numValue.toString();
+
+    navigator.clipboard.writeText(text).then(() => {
+        const button = element.nextElementSibling;
+        const originalText = button.textContent;
+        button.textContent = '🟢✅';
+        setTimeout(() => {
+            button.textContent = originalText;
+        }, 1000);
+    }).catch(() => {
+        // Fallback for older browsers
+        const textArea = document.createElement('textarea');
+        textArea.value = text;
+        document.body.appendChild(textArea);
+        textArea.select();
+        document.execCommand('copy');
+        document.body.removeChild(textArea);
+    });
+}
+
+// Initialize when page loads
+document.addEventListener('DOMContentLoaded', function() {
+    console.log('Page loaded - testing console'); // Test console
+    loadSettings();
+    updateDirection();
+    updateLeverage();
+    updateTPMode();
+});
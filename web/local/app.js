@@ -0,0 +1,59 @@
+function updateLeverage() {
+    const leverage = document.getElementById('leverage').value;
+    document.getElementById('leverageValue').textContent = leverage + 'X';
+}
+
+function calculate() {
+    const price = parseFloat(document.getElementById('price').value) || 0;
+    const maxLoss = parseFloat(document.getElementById('maxLoss').value) || 0;
+    const stopLoss = parseFloat(document.getElementById('stopLoss').value) || 0;
+    const leverage = parseInt(document.getElementById('leverage').value) || 1;
+
+    if (price <= 0 || stopLoss <= 0) {
+        alert('Bitte gültige Werte eingeben!');
+        return;
+    }
+
+    const direction = document.getElementById('direction').value;
+    const plan = {direction: direction, entry_price: price, max_loss: maxLoss,
+                  sl_percent: stopLoss, leverage: leverage};
+
+    // Über den lokalen Server rechnet die Python-Engine (gleiche Zahlen wie Desktop und Bots)
+    if (location.protocol.startsWith('http')) {
+        fetch('/api/calc', {method: 'POST', headers: {'Content-Type': 'application/json'},
+                            body: JSON.stringify(plan)})
+            .then(r => r.json())
+            .then(res => res.error ? alert(res.error) : showResults(res))
+            .catch(() => showResults(calculateLocal(plan)));
+    } else {
+        showResults(calculateLocal(plan));
+    }
+}
+
+// Offline (Datei doppelgeklickt): dieselbe Formel wie position_engine.calculate_position ohne Gebühren
+function calculateLocal(plan) {
+    const sign = plan.direction === 'long' ? 1 : -1;
+    const nominal = plan.max_loss / (plan.sl_percent / 100);
+    const slPrice = plan.entry_price * (1 - sign * plan.sl_percent / 100);
+    const slDistance = Math.abs(plan.entry_price - slPrice);
+    return {nominal: nominal, margin: nominal / plan.leverage, sl_price: slPrice,
+            tp1: plan.entry_price + sign * slDistance};
+}
+
+function showResults(res) {
+    document.getElementById('nominal').textContent = res.nominal.toFixed(2);
+    document.getElementById('margin').textContent = res.margin.toFixed(2);
+    document.getElementById('slPrice').textContent = res.sl_price.toFixed(2);
+    document.getElementById('tp1').textContent = res.tp1.toFixed(2);
+
+    document.getElementById('results').style.display = 'block';
+}
+
+function resetForm() {
+    document.getElementById('price').value = '';
+    document.getElementById('maxLoss').value = '10.00';
+    document.getElementById('stopLoss').value = '0';
+    document.getElementById('leverage').value = '1';
+    updateLeverage();
+    document.getElementById('results').style.display = 'none';
+}
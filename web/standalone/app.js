@@ -0,0 +1,71 @@
+function updateLeverage() {
+    const leverage = document.getElementById('leverage').value;
+    document.getElementById('leverageValue').textContent = leverage + 'X';
+}
+
+function calculate() {
+    const price = parseFloat(document.getElementById('price').value) || 0;
+    const maxLoss = parseFloat(document.getElementById('maxLoss').value) || 0;
+    const stopLoss = parseFloat(document.getElementById('stopLoss').value) || 0;
+    const leverage = parseInt(document.getElementById('leverage').value) || 1;
+    const direction = document.getElementById('direction').value;
+
+    if (price <= 0 || stopLoss <= 0 || maxLoss <= 0) {
+        alert('⚠️ Bitte gültige Werte eingeben!\n\n• Order Price > 0\n• Stop-Loss % > 0\n• Max Loss > 0');
+        return;
+    }
+
+    // Berechnung basierend auf dem Python-Script
+    const fees = 0.1; // 0.1% Gebühren
+    const effectivePct = (stopLoss + fees) / 100;
+    const marginRequired = maxLoss / effectivePct;
+    const nominal = marginRequired * leverage;
+
+    // Stop-Loss und Take-Profit Preise
+    let slPrice, tp1;
+    if (direction === 'long') {
+        slPrice = price * (1 - effectivePct);
+        tp1 = price * (1 + effectivePct * 2);
+    } else {
+        slPrice = price * (1 + effectivePct);
+        tp1 = price * (1 - effectivePct * 2);
+    }
+
+    const units = nominal / price;
+
+    // Ergebnisse anzeigen
+    document.getElementById('nominal').textContent = nominal.toFixed(2) + ' €';
+    document.getElementById('margin').textContent = marginRequired.toFixed(2) + ' €';
+    document.getElementById('slPrice').textContent = slPrice.toFixed(2);
+    document.getElementById('tp1').textContent = tp1.toFixed(2);
+    document.getElementById('units').textContent = units.toFixed(6);
+    document.getElementById('riskReward').textContent = '1:2';
+
+    document.getElementById('results').style.display = 'block';
+
+    // Smooth scroll zu den Ergebnissen
+    document.getElementById('results').scrollIntoView({
+        behavior: 'smooth',
+        block: 'nearest'
+    });
+}
+
+function resetForm() {
+    document.getElementById('price').value = '';
+    document.getElementById('maxLoss').value = '10.00';
+    document.getElementById('stopLoss').value = '0.5';
+    document.getElementById('leverage').value = '1';
+    document.getElementById('direction').value = 'long';
+    updateLeverage();
+    document.getElementById('results').style.display = 'none';
+}
+
+// Enter-Taste für Berechnung
+document.addEventListener('keypress', function(e) {
+    if (e.key === 'Enter') {
+        calculate();
+    }
+});
+
+// Initial setup
+updateLeverage();
@@ -5,221 +5,492 @@ Läuft auf localhost - kein Hosting nötig!
 """
 
 import webbrowser
-from http.server import HTTPServer, SimpleHTTPRequestHandler
-import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, NamedTuple, Optional, Tuple
+from urllib.parse import unquote
+import gzip
+import hashlib
+import io
+import json
+import math
+import mimetypes
 import os
+import time
+
+from build_web import build_page
+from fee_schedule import load_fee_schedule
+from liquidation import bracket_table, liquidation_for
+from nominalwert_rechner import appdata_dir, parse_num
+from position_engine import (DEFAULT_TP_PERCENT, DEFAULT_TP_R, POSITION_CACHE, TP_MODE_R, blend_tp_exits,
+                             cached_position, calculate_position, result_row)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MAX_BODY_BYTES = 64 * 1024  # a single trade plan is a few hundred bytes
+BATCH_CHUNK_BYTES = 16 * 1024  # NDJSON results are sent in chunks of about this size ...
+BATCH_FLUSH_S = 0.1            # ... or when the oldest buffered result is this old, or before waiting for input
+
+# Static files served from the asset table; anything else falls back to SimpleHTTPRequestHandler
+STATIC_EXTENSIONS = (".html", ".css", ".js", ".svg", ".png", ".jpg", ".ico")
+COMPRESSIBLE = (".html", ".css", ".js", ".svg")
+IMMUTABLE = "public, max-age=31536000, immutable"  # hashed names never change content
+
 
 def create_html():
-    """Erstellt eine standalone HTML-Datei mit der kompletten App"""
-    html_content = """
-<!DOCTYPE html>
-<html lang="de">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>💹 Nominalwert-Rechner</title>
-    <style>
-        body { 
-            font-family: 'Segoe UI', sans-serif; 
-            background: #1a1a1a; 
-            color: #ffffff; 
-            margin: 0; 
-            padding: 20px; 
-        }
-        .container { 
-            max-width: 600px; 
-            margin: 0 auto; 
-            background: #2d2d2d; 
-            padding: 20px; 
-            border-radius: 10px; 
-        }
-        .title { 
-            text-align: center; 
-            color: #e2ff00; 
-            font-size: 24px; 
-            margin-bottom: 20px; 
-        }
-        .input-group { 
-            margin-bottom: 15px; 
-        }
-        label { 
-            display: block; 
-            margin-bottom: 5px; 
-            font-weight: bold; 
-        }
-        input, select { 
-            width: 100%; 
-            padding: 10px; 
-            background: #3d3d3d; 
-            border: 2px solid #555; 
-            border-radius: 5px; 
-            color: white; 
-            font-size: 16px; 
-        }
-        button { 
-            background: #4CAF50; 
-            color: white; 
-            padding: 12px 24px; 
-            border: none; 
-            border-radius: 5px; 
-            cursor: pointer; 
-            font-size: 16px; 
-            margin: 10px 5px; 
-        }
-        button:hover { background: #45a049; }
-        .reset-btn { background: #ff6b6b; }
-        .reset-btn:hover { background: #ff5252; }
-        .results { 
-            background: #333; 
-            padding: 15px; 
-            border-radius: 5px; 
-            margin-top: 20px; 
-        }
-        .result-row { 
-            display: flex; 
-            justify-content: space-between; 
-            margin: 10px 0; 
-            padding: 8px; 
-            background: #404040; 
-            border-radius: 3px; 
-        }
-        .success { color: #4CAF50; }
-        .warning { color: #FFC107; }
-        .danger { color: #F44336; }
-        .profit { color: #00E676; }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1 class="title">💹 Nominalwert-Rechner</h1>
-        <p style="text-align: center; color: #9598a1;">Created with ♥ by WUNDAGUAD for our community</p>
-        
-        <div class="input-group">
-            <label>Richtung:</label>
-            <select id="direction">
-                <option value="long">📈 Long</option>
-                <option value="short">📉 Short</option>
-            </select>
-        </div>
-        
-        <div class="input-group">
-            <label>Order Price:</label>
-            <input type="number" id="price" step="0.01" placeholder="z.B. 50000">
-        </div>
-        
-        <div class="input-group">
-            <label>Max. Loss (€):</label>
-            <input type="number" id="maxLoss" step="0.01" value="10.00">
-        </div>
-        
-        <div class="input-group">
-            <label>Stop-Loss %:</label>
-            <input type="number" id="stopLoss" step="0.01" value="0">
-        </div>
-        
-        <div class="input-group">
-            <label>Leverage:</label>
-            <input type="range" id="leverage" min="1" max="100" value="1" oninput="updateLeverage()">
-            <span id="leverageValue">1X</span>
-        </div>
-        
-        <button onclick="calculate()">Berechnen</button>
-        <button class="reset-btn" onclick="resetForm()">🔄 Reset</button>
-        
-        <div class="results" id="results" style="display: none;">
-            <h3>📊 Ergebnisse</h3>
-            <div class="result-row">
-                <span>💰 Nominal Value:</span>
-                <span id="nominal" class="success">0.00</span>
-            </div>
-            <div class="result-row">
-                <span>💳 Margin:</span>
-                <span id="margin" class="warning">0.00</span>
-            </div>
-            <div class="result-row">
-                <span>🛑 Stop-Loss:</span>
-                <span id="slPrice" class="danger">0.00</span>
-            </div>
-            <div class="result-row">
-                <span>🎯 TP1:</span>
-                <span id="tp1" class="profit">0.00</span>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        function updateLeverage() {
-            const leverage = document.getElementById('leverage').value;
-            document.getElementById('leverageValue').textContent = leverage + 'X';
-        }
-        
-        function calculate() {
-            const price = parseFloat(document.getElementById('price').value) || 0;
-            const maxLoss = parseFloat(document.getElementById('maxLoss').value) || 0;
-            const stopLoss = parseFloat(document.getElementById('stopLoss').value) || 0;
-            const leverage = parseInt(document.getElementById('leverage').value) || 1;
-            
-            if (price <= 0 || stopLoss <= 0) {
-                alert('Bitte gültige Werte eingeben!');
-                return;
-            }
-            
-            // Vereinfachte Berechnung (wie im Python-Script)
-            const effectivePct = stopLoss / 100;
-            const marginRequired = maxLoss / effectivePct;
-            const nominal = marginRequired * leverage;
-            const slPrice = price * (1 - effectivePct);
-            const tp1 = price * (1 + effectivePct * 2);
-            
-            // Ergebnisse anzeigen
-            document.getElementById('nominal').textContent = nominal.toFixed(2);
-            document.getElementById('margin').textContent = marginRequired.toFixed(2);
-            document.getElementById('slPrice').textContent = slPrice.toFixed(2);
-            document.getElementById('tp1').textContent = tp1.toFixed(2);
-            
-            document.getElementById('results').style.display = 'block';
-        }
-        
-        function resetForm() {
-            document.getElementById('price').value = '';
-            document.getElementById('maxLoss').value = '10.00';
-            document.getElementById('stopLoss').value = '0';
-            document.getElementById('leverage').value = '1';
-            updateLeverage();
-            document.getElementById('results').style.display = 'none';
-        }
-    </script>
-</body>
-</html>
-"""
-    
-    with open('nominalwert_rechner.html', 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    """Erstellt eine standalone HTML-Datei mit der kompletten App (Quellen: web/local/)"""
+    build_page("local")
     
     print("✅ HTML-Datei erstellt: nominalwert_rechner.html")
     print("📂 Einfach die Datei doppelklicken zum Öffnen!")
 
-def start_local_server():
+
+def _number(value, key: str, number_format: str) -> float:
+    """JSON number, or a string in number_format ("65.000,5" with german)."""
+    if value is None:
+        raise ValueError(f"Missing field: {key}")
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise ValueError(f"{key} must be a number.")
+    return float(value) if not isinstance(value, str) else parse_num(value, number_format)
+
+
+def _number_list(values, key: str, number_format: str):
+    if not isinstance(values, (list, tuple)):
+        raise ValueError(f"{key} must be a list.")
+    return [_number(v, key, number_format) for v in values]
+
+
+def _side(plan: dict, key: str) -> str:
+    side = plan.get(key, "Taker")
+    if not isinstance(side, str):
+        raise ValueError(f"{key} must be Maker or Taker.")
+    return side
+
+
+def calc_plan(plan: dict, cache: bool = True) -> dict:
+    """
+    Size one trade plan with the Python engine - the /api/calc payload.
+
+    Required: direction, entry_price, max_loss, sl_percent. Optional: leverage,
+    entry_fee/exit_fee in %, or fee_tier ('exchange/tier' of fee_schedule.json)
+    with entry_side/exit_side (Maker/Taker) and fee_discount; tp_mode, tp_values,
+    tp_close (percent closed per level, adds blended_gross/blended_net),
+    fees_in_risk, liq_table ('exchange/SYMBOL', adds the liquidation columns)
+    and number_format for numbers sent as strings (default us).
+    Returns the calculate_batch row layout plus effective_risk_pct. With cache
+    the sizing goes through POSITION_CACHE, keyed on the parsed numbers.
+    """
+    if not isinstance(plan, dict):
+        raise ValueError("Trade plan must be a JSON object.")
+    number_format = plan.get("number_format", "us")
+    num = lambda key, default=None: _number(plan.get(key, default), key, number_format)
+    direction = plan.get("direction")
+    if not isinstance(direction, str):
+        raise ValueError("Missing field: direction")
+
+    tier = plan.get("fee_tier")
+    if tier:
+        schedule, discount = load_fee_schedule(), bool(plan.get("fee_discount", False))
+        entry_fee = schedule.fee(tier, _side(plan, "entry_side"), discount)
+        exit_fee = schedule.fee(tier, _side(plan, "exit_side"), discount)
+    else:
+        entry_fee, exit_fee = num("entry_fee", 0.0), num("exit_fee", 0.0)
+    mode = plan.get("tp_mode", TP_MODE_R)
+    tp_values = plan.get("tp_values") or (DEFAULT_TP_R if mode == TP_MODE_R else DEFAULT_TP_PERCENT)
+    tp_values = _number_list(tp_values, "tp_values", number_format)
+
+    size = cached_position if cache else calculate_position
+    res = size(direction, num("entry_price"), num("max_loss"), num("sl_percent"),
+               num("leverage", 1), entry_fee, exit_fee, mode, tp_values, bool(plan.get("fees_in_risk", False)))
+    out = result_row(res)
+    out["effective_risk_pct"] = res.effective_risk_pct
+    if plan.get("tp_close"):
+        ladder = blend_tp_exits(res, [c / 100.0 for c in _number_list(plan["tp_close"], "tp_close", number_format)])
+        out["blended_gross"], out["blended_net"] = ladder.blended_gross, ladder.blended_net
+    if plan.get("liq_table"):
+        out.update(liquidation_for(res, bracket_table(plan["liq_table"]))._asdict())
+    bad = [k for k, v in out.items() if isinstance(v, float) and not math.isfinite(v)]
+    if bad:  # e.g. a tiny sl_percent; Infinity/NaN is not valid JSON
+        raise ValueError(f"Result out of range ({', '.join(bad)}) - check the inputs.")
+    return out
+
+
+class Asset(NamedTuple):
+    """One static file, prepared at startup: encoding ('' = identity) -> (file, size, ETag)."""
+    name: str
+    hashed_name: str  # logo.<hash>.png - served with IMMUTABLE caching
+    content_type: str
+    variants: Dict[str, Tuple[str, int, str]]
+
+
+def _brotli():
+    try:
+        import brotli  # optional: pip install brotli
+        return brotli
+    except ImportError:
+        return None
+
+
+def _cached_file(cache_dir: str, name: str, make) -> str:
+    """cache_dir/name, written by make() only if it doesn't exist yet (names contain the content hash)."""
+    path = os.path.join(cache_dir, name)
+    if not os.path.exists(path):
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(make())
+        os.replace(tmp, path)
+    return path
+
+
+def build_assets(root: str = HERE, cache_dir: str = None) -> Dict[str, Tuple[Asset, bool]]:
+    """
+    URL path -> (Asset, immutable) for the web files in root.
+
+    Every file gets a strong ETag from its SHA-256 and a content-hashed alias.
+    HTML, CSS, JS and SVG also get gzip (and brotli, if installed) variants, kept in
+    cache_dir (appdata/web_cache) so sendfile can serve them and restarts reuse them.
+    References between assets in HTML are rewritten to the hashed names.
+    """
+    cache_dir = cache_dir or os.path.join(appdata_dir(), "web_cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    brotli = _brotli()
+    names = sorted((n for n in os.listdir(root) if n.lower().endswith(STATIC_EXTENSIONS)
+                    and os.path.isfile(os.path.join(root, n))), key=lambda n: (n.lower().endswith(".html"), n))
+    assets, hashed, used = {}, {}, set()
+    for name in names:  # HTML last: it may reference the others
+        path = os.path.join(root, name)
+        with open(path, "rb") as f:
+            data = original = f.read()
+        if name.lower().endswith(".html"):
+            for old, new in hashed.items():
+                data = data.replace(f'"{old}"'.encode(), f'"{new}"'.encode()).replace(f"'{old}'".encode(), f"'{new}'".encode())
+        digest = hashlib.sha256(data).hexdigest()[:16]
+        stem, ext = os.path.splitext(name)
+        variants = {}
+        if data is not original:  # rewritten HTML is served from the cache
+            path = _cached_file(cache_dir, f"{digest}{ext}", lambda: data)
+            used.add(os.path.basename(path))
+        variants[""] = (path, len(data), f'"{digest}"')
+        if name.lower().endswith(COMPRESSIBLE):
+            encoders = [("gzip", "gz", lambda: gzip.compress(data, 9, mtime=0))]
+            if brotli is not None:
+                encoders.append(("br", "br", lambda: brotli.compress(data, quality=11)))
+            for encoding, suffix, make in encoders:
+                packed = _cached_file(cache_dir, f"{digest}.{suffix}", make)
+                used.add(os.path.basename(packed))
+                size = os.path.getsize(packed)
+                if size < len(data):
+                    variants[encoding] = (packed, size, f'"{digest}-{suffix}"')
+        content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        if content_type.startswith("text/"):
+            content_type += "; charset=utf-8"
+        asset = Asset(name, f"{stem}.{digest[:12]}{ext}", content_type, variants)
+        hashed[name] = asset.hashed_name
+        assets["/" + name] = (asset, False)
+        assets["/" + asset.hashed_name] = (asset, True)
+    if "/index.html" in assets:
+        assets["/"] = assets["/index.html"]
+    for stale in set(os.listdir(cache_dir)) - used:  # earlier versions of the files
+        try:
+            os.remove(os.path.join(cache_dir, stale))
+        except OSError:
+            pass
+    return assets
+
+
+def _accepted_encodings(header: str):
+    """Codings of an Accept-Encoding header, without those refused with q=0."""
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        if params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def _pick_variant(asset: Asset, accept_encoding: str) -> Tuple[str, Tuple[str, int, str]]:
+    if len(asset.variants) > 1:
+        accepted = _accepted_encodings(accept_encoding)
+        for encoding in ("br", "gzip"):
+            if encoding in asset.variants and encoding in accepted:
+                return encoding, asset.variants[encoding]
+    return "", asset.variants[""]
+
+
+class _ChunkedBody(io.RawIOBase):
+    """
+    Request body sent with Transfer-Encoding: chunked, decoded while it arrives.
+    on_wait runs before every read from the connection, which may block until the client sends more.
+    """
+
+    def __init__(self, rfile, on_wait=None):
+        self.rfile, self.left, self.done, self.on_wait = rfile, 0, False, on_wait
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if self.done:
+            return 0
+        if self.on_wait:
+            self.on_wait()
+        if self.left == 0:
+            size = int(self.rfile.readline(1024).split(b";", 1)[0], 16)
+            if size == 0:
+                while self.rfile.readline(1024) not in (b"\r\n", b"\n", b""):
+                    pass  # trailers
+                self.done = True
+                return 0
+            self.left = size
+        data = self.rfile.read1(min(len(b), self.left))  # what has arrived; read() would wait for all of it
+        if not data:
+            raise ValueError("Request body ended inside a chunk.")
+        b[:len(data)] = data
+        self.left -= len(data)
+        if self.left == 0:
+            self.rfile.readline(1024)  # CRLF after the chunk data
+        return len(data)
+
+
+class _SizedBody(io.RawIOBase):
+    """Request body with Content-Length - stops there, so keep-alive stays in sync. on_wait as for _ChunkedBody."""
+
+    def __init__(self, rfile, length: int, on_wait=None):
+        self.rfile, self.left, self.on_wait = rfile, length, on_wait
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if self.left and self.on_wait:
+            self.on_wait()
+        data = self.rfile.read1(min(len(b), self.left)) if self.left else b""
+        b[:len(data)] = data
+        self.left -= len(data)
+        return len(data)
+
+
+def _ndjson_lines(body):
+    """(line number, plan bytes or None if longer than MAX_BODY_BYTES) - one line in memory at a time."""
+    n = 0
+    while True:
+        line = body.readline(MAX_BODY_BYTES + 1)
+        if not line:
+            return
+        n += 1
+        if len(line) > MAX_BODY_BYTES and not line.endswith(b"\n"):
+            while line and not line.endswith(b"\n"):
+                line = body.readline(MAX_BODY_BYTES)
+            yield n, None
+        elif line.strip():
+            yield n, line
+
+
+def calc_ndjson(body):
+    """
+    Result lines for a stream of NDJSON trade plans - the /api/calc/batch payload.
+
+    Each output line is the calc_plan result (with the plan's "id" echoed if it
+    has one) or {"line": n, "error": "..."}; a bad plan never stops the batch.
+    Bulk plans bypass POSITION_CACHE - they would only push out the hot setups.
+    """
+    dumps = json.JSONEncoder(separators=(",", ":"), allow_nan=False).encode
+    for n, line in _ndjson_lines(body):
+        try:
+            if line is None:
+                raise ValueError(f"Line longer than {MAX_BODY_BYTES} bytes.")
+            plan = json.loads(line)
+            out = calc_plan(plan, cache=False)
+            if "id" in plan:
+                out = {"id": plan["id"], **out}
+            encoded = dumps(out)  # inside the try: an unencodable id is this plan's error too
+        except Exception as e:  # whatever one plan raises, the stream and its final chunk must go on
+            encoded = dumps({"line": n, "error": str(e)})
+        yield encoded.encode("utf-8") + b"\n"
+
+
+class Handler(SimpleHTTPRequestHandler):
+    """Static files of the app folder plus the JSON API under /api/."""
+    protocol_version = "HTTP/1.1"   # keep-alive: bots and the page reuse one connection
+    disable_nagle_algorithm = True  # headers and body are separate writes; don't wait for the ACK
+    cache_control = 'no-cache'      # per response; the asset table sets its own
+
+    def parse_request(self):
+        self.cache_control = Handler.cache_control  # one handler serves every request of a keep-alive connection
+        return super().parse_request()
+
+    def end_headers(self):
+        self.send_header('Cache-Control', self.cache_control)
+        super().end_headers()
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] == "/api/stats":
+            self.cache_control = "no-store"
+            stats = POSITION_CACHE.stats()
+            self._send_json(200, {"position_cache": {**stats._asdict(), "hit_rate": round(stats.hit_rate, 4)}},
+                            time.perf_counter())
+        elif not self._send_asset(head=False):
+            super().do_GET()
+
+    def do_HEAD(self):
+        if not self._send_asset(head=True):
+            super().do_HEAD()
+
+    def _send_asset(self, head: bool) -> bool:
+        """Serve from the asset table: 304 on a matching ETag, else the best encoding via sendfile."""
+        entry = self.server.assets.get(unquote(self.path.split("?", 1)[0]))
+        if entry is None:
+            return False
+        asset, immutable = entry
+        encoding, (path, size, etag) = _pick_variant(asset, self.headers.get("Accept-Encoding", ""))
+        self.cache_control = IMMUTABLE if immutable else "no-cache"
+        if_none_match = self.headers.get("If-None-Match", "")
+        if if_none_match.strip() == "*" or etag in (t.strip() for t in if_none_match.split(",")):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            if len(asset.variants) > 1:
+                self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return True
+        try:
+            f = open(path, "rb")
+        except OSError:
+            self.send_error(404, "File not found")
+            return True
+        with f:
+            self.send_response(200)
+            self.send_header("Content-Type", asset.content_type)
+            self.send_header("Content-Length", str(size))
+            self.send_header("ETag", etag)
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            if len(asset.variants) > 1:
+                self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            if not head:
+                self.connection.sendfile(f)  # os.sendfile (zero-copy) where available, send() loop elsewhere
+        return True
+
+    def log_request(self, code="-", size="-"):
+        # One stderr line per API call would cost more than the calculation itself
+        if not self.path.startswith("/api/") or (isinstance(code, int) and code >= 400):
+            super().log_request(code, size)
+
+    def do_POST(self):
+        route = self.path.split("?", 1)[0]
+        if route == "/api/calc":
+            self._api_calc()
+        elif route == "/api/calc/batch":
+            self._api_calc_batch()
+        else:
+            self.send_error(404, "Unknown API endpoint")
+
+    def _api_calc(self):
+        started = time.perf_counter()
+        self.cache_control = "no-store"
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if not 0 < length <= MAX_BODY_BYTES:
+            self.close_connection = True  # body not read; the connection can't be reused
+            self._send_json(413 if length > MAX_BODY_BYTES else 411, {"error": "Content-Length required (max 64 KB)."}, started)
+            return
+        try:
+            result = calc_plan(json.loads(self.rfile.read(length)))
+        except (ValueError, TypeError, ZeroDivisionError) as e:
+            self._send_json(400, {"error": str(e)}, started)
+            return
+        except Exception as e:  # a bug in the engine must still get an answer, not a dropped connection
+            self.log_error("calc failed: %r", e)
+            self._send_json(500, {"error": f"Internal error: {e}"}, started)
+            return
+        self._send_json(200, result, started)
+
+    def _api_calc_batch(self):
+        """
+        NDJSON in, NDJSON out; both streamed, so memory stays at one line plus one chunk.
+        Buffered results go out before every wait for input, so a client that pauses
+        mid-batch still gets the results of everything it has sent.
+        """
+        self.cache_control = "no-store"
+        buf, size, oldest = [], 0, 0.0
+
+        def flush():
+            nonlocal buf, size
+            if buf:
+                self._write_chunk(b"".join(buf))
+                buf, size = [], 0
+
+        if "chunked" in self.headers.get("Transfer-Encoding", "").lower():
+            raw = _ChunkedBody(self.rfile, flush)
+        else:
+            try:
+                raw = _SizedBody(self.rfile, int(self.headers.get("Content-Length") or 0), flush)
+            except ValueError:
+                self.send_error(400, "Bad Content-Length")
+                return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        try:
+            # The reader asks raw for more only when its buffer is empty - that's where flush() runs
+            for line in calc_ndjson(io.BufferedReader(raw, 64 * 1024)):
+                if not buf:
+                    oldest = time.monotonic()
+                buf.append(line)
+                size += len(line)
+                if size >= BATCH_CHUNK_BYTES or time.monotonic() - oldest >= BATCH_FLUSH_S:
+                    flush()
+        except ValueError as e:  # broken chunked framing: report it, then drop the connection
+            buf.append(json.dumps({"error": str(e)}).encode("utf-8") + b"\n")
+            self.close_connection = True
+        flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _write_chunk(self, data: bytes):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+    def _send_json(self, status: int, payload: dict, started: float):
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Server-Timing", f"calc;dur={(time.perf_counter() - started) * 1e3:.3f}")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class LocalServer(ThreadingHTTPServer):
+    """One thread per connection, so a slow client doesn't block the others."""
+    request_queue_size = 128  # many clients connecting at once; the default backlog of 5 drops SYNs
+    assets: Dict[str, Tuple[Asset, bool]] = {}
+
+
+def make_server(host: str = "localhost", port: int = 8080, cache_dir: Optional[str] = None) -> LocalServer:
+    """Server for HERE; the static asset table is built once, here (edit files -> restart)."""
+    server = LocalServer((host, port), partial(Handler, directory=HERE))
+    server.assets = build_assets(HERE, cache_dir)
+    return server
+
+
+def start_local_server(port: int = 8080, open_browser: bool = True):
     """Startet lokalen Server für die Web-App"""
-    os.chdir(os.path.dirname(os.path.abspath(__file__)))
-    
-    class Handler(SimpleHTTPRequestHandler):
-        def end_headers(self):
-            self.send_header('Cache-Control', 'no-cache')
-            super().end_headers()
-    
-    server = HTTPServer(('localhost', 8080), Handler)
-    print("🌐 Server läuft auf: http://localhost:8080")
+    server = make_server("localhost", port)
+    print(f"🌐 Server läuft auf: http://localhost:{port}")
+    print(f"🧮 Rechen-API: POST http://localhost:{port}/api/calc (NDJSON: /api/calc/batch, Cache: GET /api/stats)")
     print("🔄 Drücke Ctrl+C zum Beenden")
     
     # Browser automatisch öffnen
-    webbrowser.open('http://localhost:8080/nominalwert_rechner.html')
+    if open_browser:
+        webbrowser.open(f'http://localhost:{port}/nominalwert_rechner.html')
     
     try:
         server.serve_forever()
     except KeyboardInterrupt:
         print("\n👋 Server beendet")
-        server.shutdown()
+        server.server_close()
 
 if __name__ == "__main__":
     create_html()